@@ -1,9 +1,9 @@
 import os
+import re
 import time
-from datetime import datetime
 import logging
 import threading
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 
 from app.services.scraper import FTScraper
 from app.services.prioritizator import GeopoliticalPrioritizer, read_articles_from_folder
@@ -12,6 +12,39 @@ from app.services.tts import UnrealSpeechTTS
 
 logger = logging.getLogger(__name__)
 
+# Threads writing article files; writes overlap instead of waiting on each
+# file in turn
+FILE_WRITE_WORKERS = 8
+
+ARTICLE_SEPARATOR = "\n" + "="*50 + "\n\n"
+
+# Characters dropped from titles used in file names: anything but letters,
+# digits, spaces, hyphens and underscores (\w is exactly str.isalnum() plus "_")
+UNSAFE_TITLE_CHARS = re.compile(r'[^\w \-]')
+
+def _safe_title(title: str) -> str:
+    """File-name-safe form of a title, limited to 50 characters"""
+    return UNSAFE_TITLE_CHARS.sub('', title).rstrip()[:50]
+
+def _format_preview(preview) -> str:
+    """Header block of an article file"""
+    parts = [f"Title: {preview['headline']}\n", f"URL: {preview['url']}\n"]
+    if preview['standfirst']:
+        parts.append(f"Summary: {preview['standfirst']}\n")
+    parts.append(ARTICLE_SEPARATOR)
+    return "".join(parts)
+
+def _format_full_article(full_article) -> str:
+    """Metadata and body appended below an article file's header"""
+    parts = []
+    if full_article.get('date'):
+        parts.append(f"Date: {full_article['date']}\n")
+    if full_article.get('author'):
+        parts.append(f"Author: {full_article['author']}\n")
+    parts.append(ARTICLE_SEPARATOR)
+    parts.append(full_article['full_text'])
+    return "".join(parts)
+
 class NewsPipeline:
     def __init__(self):
         self.scraper = None
@@ -26,7 +59,6 @@ class NewsPipeline:
         self.is_paused = False
         self.current_audio_index = -1
         self.pause_position = 0
-        self.last_login_file = "last_login.txt"
 
         # Create necessary directories
         os.makedirs(self.output_dir, exist_ok=True)
@@ -61,53 +93,24 @@ class NewsPipeline:
         if self.scraper:
             self.scraper.force_cleanup()
 
-    def _get_last_login_time(self) -> Optional[datetime]:
-        """Get the last login time from the file"""
-        try:
-            if os.path.exists(self.last_login_file):
-                with open(self.last_login_file, 'r') as f:
-                    timestamp = float(f.read().strip())
-                    return datetime.fromtimestamp(timestamp)
-        except Exception as e:
-            logger.error(f"Error reading last login time: {str(e)}")
-        return None
-
-    def _update_last_login_time(self):
-        """Update the last login time in the file"""
-        try:
-            with open(self.last_login_file, 'w') as f:
-                f.write(str(time.time()))
-        except Exception as e:
-            logger.error(f"Error updating last login time: {str(e)}")
-
-    def _should_skip_scraping(self) -> bool:
-        """Check if we should skip scraping based on last login time"""
-        last_login = self._get_last_login_time()
-        if last_login:
-            time_since_login = datetime.now() - last_login
-            if time_since_login.total_seconds() < 3600:  # Less than 1 hour
-                logger.info(f"Last login was {time_since_login.total_seconds()/60:.1f} minutes ago, skipping scraping")
-                return True
-        return False
-
     def scrape_articles(self):
         """Step 1: Scrape articles from FT"""
         logger.info("="*50)
         logger.info("STEP 1: Starting article scraping...")
         logger.info("="*50)
 
-        # Check if we should skip scraping
-        if self._should_skip_scraping():
-            logger.info("Skipping article scraping due to recent login")
-            return
-
-        # Refresh session if needed
-        if not self.scraper.refresh_session_if_needed():
-            logger.error("Failed to refresh session")
-            return
-
         start_time = time.time()
-        previews = self.scraper.scrape_articles()
+        # Previews scraped within PREVIEW_CACHE_TTL (by an earlier run or the
+        # API) are reused without signing in or loading the front page
+        previews = self.scraper.cached_previews()
+        if previews:
+            logger.info(f"Reusing {len(previews)} recently scraped article previews")
+        else:
+            # Refresh session if needed
+            if not self.scraper.refresh_session_if_needed():
+                logger.error("Failed to refresh session")
+                return
+            previews = self.scraper.scrape_articles(force_refresh=True)
         end_time = time.time()
 
         if not previews:
@@ -117,47 +120,47 @@ class NewsPipeline:
         logger.info(f"Article scraping completed in {end_time - start_time:.2f} seconds")
         logger.info("="*50)
 
-        # Update last login time
-        self._update_last_login_time()
-
         # Save previews to files
+        filenames = []
         for i, preview in enumerate(previews, 1):
+            filenames.append(os.path.join(self.output_dir, f"article_{i}_{_safe_title(preview['headline'])}.txt"))
+
+        def save_preview(i, filename, preview):
             logger.info(f"Processing preview {i} of {len(previews)}")
-            safe_title = "".join(c for c in preview['headline'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            filename = os.path.join(self.output_dir, f"article_{i}_{safe_title[:50]}.txt")
-            
             try:
                 with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(f"Title: {preview['headline']}\n")
-                    f.write(f"URL: {preview['url']}\n")
-                    if preview['standfirst']:
-                        f.write(f"Summary: {preview['standfirst']}\n")
-                    f.write("\n" + "="*50 + "\n\n")
+                    f.write(_format_preview(preview))
                 logger.info(f"Saved preview to: {filename}")
             except Exception as e:
                 logger.error(f"Failed to save preview {i}: {str(e)}")
 
-        # Now fetch full content for each article
-        for i, preview in enumerate(previews, 1):
-            logger.info(f"Fetching full content for article {i} of {len(previews)}")
+        def save_full_article(i, filename, full_article, preview_write):
+            # The full content goes below the header written by save_preview
+            preview_write.result()
             try:
-                full_article = self.scraper.scrape_full_article(preview['url'])
                 if full_article:
                     # Update the file with full content
-                    filename = os.path.join(self.output_dir, f"article_{i}_{safe_title[:50]}.txt")
                     with open(filename, 'a', encoding='utf-8') as f:
-                        if full_article.get('date'):
-                            f.write(f"Date: {full_article['date']}\n")
-                        if full_article.get('author'):
-                            f.write(f"Author: {full_article['author']}\n")
-                        f.write("\n" + "="*50 + "\n\n")
-                        f.write(full_article['full_text'])
+                        f.write(_format_full_article(full_article))
                     logger.info(f"Updated article with full content: {filename}")
                 else:
                     logger.warning(f"Could not fetch full content for article {i}")
             except Exception as e:
                 logger.error(f"Failed to fetch full content for article {i}: {str(e)}")
-                continue
+
+        # Previews are written while full content is fetched, several pages at
+        # a time, and each article is appended to its file as soon as it
+        # arrives rather than after the slowest one
+        with ThreadPoolExecutor(max_workers=min(FILE_WRITE_WORKERS, len(previews))) as executor:
+            preview_writes = [
+                executor.submit(save_preview, i, filename, preview)
+                for i, (filename, preview) in enumerate(zip(filenames, previews), 1)
+            ]
+
+            logger.info(f"Fetching full content for {len(previews)} articles")
+            full_articles = self.scraper.iter_full_articles(preview['url'] for preview in previews)
+            for index, full_article in full_articles:
+                executor.submit(save_full_article, index + 1, filenames[index], full_article, preview_writes[index])
 
     def prioritize_articles(self):
         """Step 2: Prioritize articles"""
@@ -200,15 +203,13 @@ class NewsPipeline:
 
     def get_audio_path(self, article):
         """Get the audio file path for an article"""
-        safe_title = "".join(c for c in article.title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_title = safe_title[:50]  # Limit length
+        safe_title = _safe_title(article.title)
         return os.path.join(self.audio_dir, f"audio_{safe_title}.mp3")
 
     def generate_audio(self, article):
         """Generate audio for an article"""
         try:
-            safe_title = "".join(c for c in article.title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_title = safe_title[:50]  # Limit length
+            safe_title = _safe_title(article.title)
             
             script_path = os.path.join(self.output_dir, f"script_{safe_title}.txt")
             audio_path = os.path.join(self.audio_dir, f"audio_{safe_title}.mp3")
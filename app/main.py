@@ -71,6 +71,10 @@ async def initialize_scraper(config: ScraperConfig):
     """Initialize the FT scraper with credentials"""
     global scraper
     try:
+        # Quit the previous driver, which also frees the Chrome profile
+        if scraper:
+            scraper.force_cleanup()
+            scraper = None
         scraper = FTScraper(
             username=config.username,
             uni_id=config.uni_id,
@@ -91,11 +95,12 @@ async def get_articles():
         raise HTTPException(status_code=400, detail="Scraper not initialized")
     
     try:
-        # Refresh session if needed
-        scraper.refresh_session_if_needed()
-        
-        # Get article previews
-        articles = scraper.scrape_articles()
+        # Recently scraped previews need no session; only refresh it (which
+        # loads a page) when the front page has to be scraped again
+        articles = scraper.cached_previews()
+        if not articles:
+            scraper.refresh_session_if_needed()
+            articles = scraper.scrape_articles(force_refresh=True)
         if not articles:
             raise HTTPException(status_code=404, detail="No articles found")
             
@@ -1,12 +1,20 @@
 import os
+import json
 import time
+import queue
+import shelve
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+
+from ft_urls import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +25,140 @@ def setup_logging():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+# Drivers used to fetch full articles concurrently, including the scraper's own
+FULL_ARTICLE_WORKERS = 4
+
+# Login flow elements
+INSTITUTIONAL_LOGIN_BUTTON = (By.CSS_SELECTOR, '[data-trackable="institutional-login"]')
+INSTITUTION_ID_INPUT = (By.ID, 'institutionId')
+CONTINUE_BUTTON = (By.CSS_SELECTOR, '[data-trackable="continue"]')
+USERNAME_INPUT = (By.ID, 'username')
+PASSWORD_INPUT = (By.ID, 'password')
+SIGN_IN_BUTTON = (By.CSS_SELECTOR, '[data-trackable="sign-in"]')
+# Only present when signed in
+MY_ACCOUNT_LINK = (By.CSS_SELECTOR, '[data-trackable="my-account"]')
+
+# Front-page teasers
+TEASER_SELECTOR = '.js-teaser'
+TEASER_HEADING_SELECTOR = '.js-teaser-heading-link'
+TEASER_STANDFIRST_SELECTOR = '.js-teaser-standfirst'
+
+# Article page content, timestamp and author
+ARTICLE_CONTENT_SELECTOR = '.article__content'
+ARTICLE_FIELD_SELECTORS = (ARTICLE_CONTENT_SELECTOR, '.article__timestamp', '.article__author-name')
+
+# Content, timestamp and author of a loaded article page, read in one
+# round-trip; missing elements come back as null
+ARTICLE_FIELDS_JS = """
+const text = (selector) => {
+    const element = document.querySelector(selector);
+    return element ? element.innerText.trim() : null;
+};
+return arguments[0].map(text);
+"""
+
+# URLs Chrome is told not to fetch: the scraper only reads page text, so images,
+# fonts, media and ad/analytics scripts are dead weight on every page load
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.mp4', '*.webm',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*facebook.net*',
+]
+
+# Headline, URL and standfirst of every teaser on the page in a single
+# WebDriver call instead of several find_element round-trips per teaser
+EXTRACT_PREVIEWS_JS = """
+const text = node => node ? node.innerText.trim() : null;
+const [teaserSel, headingSel, standfirstSel] = arguments;
+return Array.from(document.querySelectorAll(teaserSel)).map(teaser => {
+    const link = teaser.querySelector(headingSel);
+    return {
+        headline: text(link),
+        url: link ? link.href : null,
+        standfirst: text(teaser.querySelector(standfirstSel))
+    };
+});
+"""
+
+# Article previews taken from the front page per scrape
+MAX_PREVIEWS = 10
+
+CACHE_DIR = '.cache'
+
+# Front-page previews are reused for this long before the page is scraped
+# again; the pipeline runs no more than hourly, so one run's previews serve
+# it and the API until the next
+PREVIEW_CACHE_TTL = 3600  # seconds
+
+# Full articles rarely change once published, so a scraped article is reused
+# for a day before its page is loaded again
+FULL_ARTICLE_CACHE_PATH = os.path.join(CACHE_DIR, 'full_articles')
+FULL_ARTICLE_CACHE_TTL = 24 * 3600  # seconds
+# shelve is not safe for concurrent use by the full-article worker threads
+_full_article_cache_lock = threading.Lock()
+
+# Chrome profile of the scraper's main driver; keeping its cookies and cache
+# between runs lets a still-valid FT session skip the login flow. Set to an
+# empty string to start from a fresh profile every time.
+CHROME_PROFILE_DIR = os.getenv('FT_CHROME_PROFILE_DIR', os.path.join(os.path.expanduser('~'), '.ft_scraper_profile'))
+
+def _lock_profile_dir(profile_dir):
+    """Lock profile_dir for one scraper; returns the held lock file, or None if another scraper has it"""
+    lock_path = profile_dir.rstrip(os.sep) + '.lock'
+    os.makedirs(os.path.dirname(lock_path) or '.', exist_ok=True)
+    lock_file = open(lock_path, 'w')
+    try:
+        import fcntl
+    except ImportError:
+        # No fcntl (Windows): left to Chrome's own profile lock
+        return lock_file
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+# Explicit waits check their condition every 100 ms rather than WebDriverWait's
+# default 500 ms, so a step continues soon after its element appears, at the
+# cost of a few more chromedriver calls while waiting
+WAIT_POLL_FREQUENCY = 0.1
+
+def wait_for(driver, timeout=10):
+    """Return an explicit wait on driver using the scraper's poll frequency"""
+    return WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+
+# Content settings that stop images loading and notification prompts at the
+# renderer, including anything BLOCKED_URL_PATTERNS does not match
+CHROME_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2,
+}
+
+def build_driver(profile_dir=None):
+    """Create a headless Chrome driver with the scraper's standard options."""
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_experimental_option('prefs', CHROME_PREFS)
+    # driver.get returns at DOMContentLoaded instead of waiting for every
+    # tracker and late script; each step then waits explicitly for the
+    # element it needs
+    chrome_options.page_load_strategy = 'eager'
+    if profile_dir:
+        chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+    
+    # No implicit wait: every lookup of an element that may be missing
+    # (standfirst, date, author) would stall for the full timeout. Steps
+    # that need an element to appear wait for it explicitly.
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    return driver
+
 class FTScraper:
     def __init__(self, username, uni_id, password):
         self.username = username
@@ -24,57 +166,105 @@ class FTScraper:
         self.password = password
         self.driver = None
         self.is_logged_in = False
+        # Lock on CHROME_PROFILE_DIR while this scraper's driver uses it
+        self._profile_lock = None
         self._initialize_driver()
 
     def _initialize_driver(self):
         """Initialize the Chrome WebDriver with appropriate options"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.implicitly_wait(10)
+        profile_dir = None
+        if CHROME_PROFILE_DIR:
+            self._profile_lock = _lock_profile_dir(CHROME_PROFILE_DIR)
+            if self._profile_lock is not None:
+                profile_dir = CHROME_PROFILE_DIR
+            else:
+                # Chrome can't open one profile twice; this driver starts
+                # from a fresh temporary profile and logs in itself
+                logger.info("Chrome profile in use by another scraper, using a fresh profile")
+        try:
+            self.driver = build_driver(profile_dir)
+        except Exception:
+            self._release_profile()
+            raise
+
+    def _release_profile(self):
+        """Let another scraper use the shared Chrome profile"""
+        if self._profile_lock is not None:
+            self._profile_lock.close()
+            self._profile_lock = None
+
+    def _clone_session_driver(self):
+        """Start another driver logged in with this driver's FT session cookies"""
+        driver = build_driver()
+        try:
+            # Cookies can only be set for the domain currently loaded
+            driver.get('https://www.ft.com/')
+            for cookie in self.driver.get_cookies():
+                driver.add_cookie(cookie)
+        except Exception:
+            driver.quit()
+            raise
+        return driver
+
+    def _has_valid_session(self, timeout=5):
+        """Check whether the driver is signed in to FT"""
+        try:
+            self.driver.get('https://www.ft.com/myaccount')
+            wait_for(self.driver, timeout).until(
+                EC.presence_of_element_located(MY_ACCOUNT_LINK)
+            )
+            return True
+        except Exception:
+            return False
 
     def login(self):
-        """Login to FT"""
+        """Login to FT, unless the Chrome profile still holds a valid session"""
+        if self._has_valid_session(timeout=2):
+            self.is_logged_in = True
+            logger.info("Reusing FT session from the Chrome profile")
+            return True
+
         try:
             self.driver.get('https://www.ft.com/signin')
             
             # Wait for and click the institutional login button
-            institutional_login = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-trackable="institutional-login"]'))
+            institutional_login = wait_for(self.driver).until(
+                EC.element_to_be_clickable(INSTITUTIONAL_LOGIN_BUTTON)
             )
             institutional_login.click()
             
             # Wait for and fill in the institutional ID
-            uni_id_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, 'institutionId'))
+            uni_id_input = wait_for(self.driver).until(
+                EC.presence_of_element_located(INSTITUTION_ID_INPUT)
             )
             uni_id_input.send_keys(self.uni_id)
             
             # Click continue
-            continue_button = self.driver.find_element(By.CSS_SELECTOR, '[data-trackable="continue"]')
+            continue_button = wait_for(self.driver).until(
+                EC.element_to_be_clickable(CONTINUE_BUTTON)
+            )
             continue_button.click()
             
             # Wait for and fill in username and password
-            username_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, 'username'))
+            username_input = wait_for(self.driver).until(
+                EC.presence_of_element_located(USERNAME_INPUT)
+            )
+            password_input = wait_for(self.driver).until(
+                EC.presence_of_element_located(PASSWORD_INPUT)
             )
-            password_input = self.driver.find_element(By.ID, 'password')
             
             username_input.send_keys(self.username)
             password_input.send_keys(self.password)
             
             # Click sign in
-            sign_in_button = self.driver.find_element(By.CSS_SELECTOR, '[data-trackable="sign-in"]')
+            sign_in_button = wait_for(self.driver).until(
+                EC.element_to_be_clickable(SIGN_IN_BUTTON)
+            )
             sign_in_button.click()
             
             # Wait for successful login
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-trackable="my-account"]'))
+            wait_for(self.driver).until(
+                EC.presence_of_element_located(MY_ACCOUNT_LINK)
             )
             
             self.is_logged_in = True
@@ -83,6 +273,7 @@ class FTScraper:
             
         except Exception as e:
             logger.error(f"Login failed: {str(e)}")
+            self.is_logged_in = False
             return False
 
     def refresh_session_if_needed(self):
@@ -90,96 +281,219 @@ class FTScraper:
         if not self.is_logged_in:
             return self.login()
         
-        try:
-            self.driver.get('https://www.ft.com/myaccount')
-            WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-trackable="my-account"]'))
-            )
+        if self._has_valid_session():
             return True
-        except:
-            logger.info("Session expired, logging in again...")
-            return self.login()
+        logger.info("Session expired, logging in again...")
+        return self.login()
+
+    def _preview_cache_path(self):
+        """Path of this user's cached preview list"""
+        # A stable digest rather than hash(), which changes between processes
+        user_key = hashlib.sha256(self.username.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(CACHE_DIR, f'previews_{user_key}.json')
+
+    def cached_previews(self):
+        """Return the cached preview list if it is younger than PREVIEW_CACHE_TTL, else None
+
+        Needs no page load, so callers check it before refreshing the session.
+        """
+        cache_path = self._preview_cache_path()
+        try:
+            if time.time() - os.path.getmtime(cache_path) >= PREVIEW_CACHE_TTL:
+                return None
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_previews(self, articles):
+        """Cache a scraped preview list"""
+        cache_path = self._preview_cache_path()
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(articles, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache article previews: {str(e)}")
+
+    def scrape_articles(self, force_refresh=False):
+        """Scrape article previews from FT, reusing a recent result unless force_refresh"""
+        if not force_refresh:
+            cached = self.cached_previews()
+            if cached:
+                logger.info(f"Using {len(cached)} cached article previews")
+                return cached
 
-    def scrape_articles(self):
-        """Scrape article previews from FT"""
         try:
             self.driver.get('https://www.ft.com/')
             
             # Wait for articles to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '.js-teaser'))
+            wait_for(self.driver).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, TEASER_SELECTOR))
             )
             
-            # Get all article previews
+            # Get all article previews; the same article is often teased
+            # several times under different tracking URLs
             articles = []
-            previews = self.driver.find_elements(By.CSS_SELECTOR, '.js-teaser')
-            
-            for preview in previews[:10]:  # Limit to 10 articles for now
-                try:
-                    headline = preview.find_element(By.CSS_SELECTOR, '.js-teaser-heading-link').text
-                    url = preview.find_element(By.CSS_SELECTOR, '.js-teaser-heading-link').get_attribute('href')
-                    
-                    try:
-                        standfirst = preview.find_element(By.CSS_SELECTOR, '.js-teaser-standfirst').text
-                    except NoSuchElementException:
-                        standfirst = None
-                    
-                    articles.append({
-                        'headline': headline,
-                        'url': url,
-                        'standfirst': standfirst
-                    })
-                    
-                except Exception as e:
-                    logger.error(f"Error processing article preview: {str(e)}")
+            seen_urls = set()
+            for preview in self.driver.execute_script(
+                EXTRACT_PREVIEWS_JS, TEASER_SELECTOR, TEASER_HEADING_SELECTOR, TEASER_STANDFIRST_SELECTOR
+            ):
+                if len(articles) >= MAX_PREVIEWS:
+                    break
+                if not preview['url']:
+                    logger.warning("Skipping article preview without a heading link")
                     continue
+                url = canonicalize_url(preview['url'])
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                articles.append({
+                    'headline': preview['headline'],
+                    'url': url,
+                    'standfirst': preview['standfirst']
+                })
             
+            if articles:
+                self._save_cached_previews(articles)
             return articles
             
         except Exception as e:
             logger.error(f"Error scraping articles: {str(e)}")
             return None
 
-    def scrape_full_article(self, url):
-        """Scrape the full content of an article"""
+    def _load_cached_full_article(self, url):
+        """Return the cached full article for url if it is younger than FULL_ARTICLE_CACHE_TTL"""
         try:
-            self.driver.get(url)
+            with _full_article_cache_lock, shelve.open(FULL_ARTICLE_CACHE_PATH, 'r') as cache:
+                entry = cache.get(canonicalize_url(url))
+        except Exception:
+            return None
+        if entry is None or time.time() - entry['scraped_at'] >= FULL_ARTICLE_CACHE_TTL:
+            return None
+        return entry['article']
+
+    def _save_cached_full_article(self, url, article):
+        """Cache a scraped full article"""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with _full_article_cache_lock, shelve.open(FULL_ARTICLE_CACHE_PATH) as cache:
+                cache[canonicalize_url(url)] = {'scraped_at': time.time(), 'article': article}
+        except Exception as e:
+            logger.warning(f"Could not cache full article: {str(e)}")
+
+    def scrape_full_article(self, url, driver=None, force_refresh=False):
+        """Scrape the full content of an article, with the given driver or the scraper's own
+
+        A copy scraped within FULL_ARTICLE_CACHE_TTL is returned without
+        loading the page, unless force_refresh.
+        """
+        if not force_refresh:
+            cached = self._load_cached_full_article(url)
+            if cached is not None:
+                return cached
+
+        driver = driver or self.driver
+        try:
+            driver.get(url)
             
             # Wait for article content to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '.article__content'))
+            wait_for(driver).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ARTICLE_CONTENT_SELECTOR))
             )
             
-            # Get article content
-            content = self.driver.find_element(By.CSS_SELECTOR, '.article__content').text
-            
-            # Get article metadata
-            try:
-                date = self.driver.find_element(By.CSS_SELECTOR, '.article__timestamp').text
-            except NoSuchElementException:
-                date = None
-                
-            try:
-                author = self.driver.find_element(By.CSS_SELECTOR, '.article__author-name').text
-            except NoSuchElementException:
-                author = None
-            
-            return {
+            # Get article content and metadata
+            content, date, author = driver.execute_script(ARTICLE_FIELDS_JS, ARTICLE_FIELD_SELECTORS)
+            
+            article = {
                 'full_text': content,
                 'date': date,
                 'author': author
             }
+            # Without a session the page may be the paywall rather than the
+            # article, which must not be served from the cache for a day
+            if self.is_logged_in:
+                self._save_cached_full_article(url, article)
+            return article
             
         except Exception as e:
             logger.error(f"Error scraping full article: {str(e)}")
             return None
 
+    def iter_full_articles(self, urls, max_workers=FULL_ARTICLE_WORKERS):
+        """Scrape the full content of several articles concurrently, yielding (index, article) as each finishes
+
+        Each article is a separate page load, so up to max_workers drivers
+        sharing this scraper's session fetch them in parallel. Failed articles
+        are None, as with scrape_full_article. Cached articles are yielded
+        first and only the rest are loaded; if no session can be established,
+        the rest are not yielded at all.
+        """
+        pending = []
+        for index, url in enumerate(urls):
+            cached = self._load_cached_full_article(url)
+            if cached is not None:
+                yield index, cached
+            else:
+                pending.append((index, url))
+        if not pending:
+            return
+
+        # Callers that only needed cached previews have not signed in yet,
+        # and the extra drivers copy this driver's session; signed out, every
+        # page would be the paywall, so nothing uncached is fetched
+        if not self.is_logged_in and not self.refresh_session_if_needed():
+            logger.error(f"Failed to refresh session, skipping {len(pending)} uncached full articles")
+            return
+
+        drivers = queue.Queue()
+        drivers.put(self.driver)
+        extra_drivers = []
+        try:
+            for _ in range(min(max_workers, len(pending)) - 1):
+                try:
+                    driver = self._clone_session_driver()
+                except Exception as e:
+                    logger.warning(f"Could not start extra driver, continuing with {drivers.qsize()}: {str(e)}")
+                    break
+                extra_drivers.append(driver)
+                drivers.put(driver)
+
+            def scrape(url):
+                driver = drivers.get()
+                try:
+                    return self.scrape_full_article(url, driver, force_refresh=True)
+                finally:
+                    drivers.put(driver)
+
+            with ThreadPoolExecutor(max_workers=drivers.qsize()) as executor:
+                futures = {executor.submit(scrape, url): index for index, url in pending}
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+        finally:
+            for driver in extra_drivers:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.warning(f"Error quitting extra driver: {str(e)}")
+
+    def scrape_full_articles(self, urls, max_workers=FULL_ARTICLE_WORKERS):
+        """Scrape the full content of several articles concurrently, in the order given"""
+        urls = list(urls)
+        full_articles = [None] * len(urls)
+        for index, full_article in self.iter_full_articles(urls, max_workers):
+            full_articles[index] = full_article
+        return full_articles
+
     def cleanup(self):
         """Clean up resources but keep the session alive"""
         if self.driver:
             self.driver.quit()
             self.driver = None
             self.is_logged_in = False
+        self._release_profile()
 
     def force_cleanup(self):
         """Force cleanup of all resources including the browser"""
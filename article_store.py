@@ -0,0 +1,139 @@
+import os
+import json
+import sqlite3
+import logging
+import threading
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.path.join("scraped_data", "ft.db")
+
+SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+CREATE TABLE IF NOT EXISTS articles (
+    canon_url TEXT PRIMARY KEY,
+    headline TEXT NOT NULL,
+    standfirst TEXT,
+    date TEXT,
+    tags TEXT,
+    scraped_at TEXT
+);
+CREATE TABLE IF NOT EXISTS visited (
+    url TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS scrapes (
+    scraped_at TEXT PRIMARY KEY,
+    article_count INTEGER NOT NULL
+);
+"""
+
+ARTICLE_COLUMNS = ("canon_url", "headline", "standfirst", "date", "tags", "scraped_at")
+
+class ArticleStore:
+    """SQLite store for scraped article previews and visited URLs.
+
+    Uses WAL mode so appends are cheap and readers never block the writer;
+    each batch is written with a single executemany.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.executescript(SCHEMA)
+        # The connection is shared between the event loop and worker threads
+        self._lock = threading.Lock()
+
+    def load_visited_urls(self) -> Set[str]:
+        """Return every URL recorded as visited."""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT url FROM visited")}
+
+    def add_visited_urls(self, urls: Iterable[str]) -> None:
+        """Record a batch of visited URLs."""
+        rows = [(url,) for url in urls]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR IGNORE INTO visited(url) VALUES (?)", rows)
+
+    def clear_visited_urls(self) -> None:
+        """Forget all visited URLs."""
+        with self._lock:
+            self._conn.execute("DELETE FROM visited")
+
+    def save_articles(self, articles: Iterable[dict]) -> None:
+        """Insert or update a batch of articles in one transaction."""
+        rows = [
+            (
+                article["url"],
+                article["headline"],
+                article.get("standfirst"),
+                article.get("date"),
+                json.dumps(article.get("tags") or []),
+                article.get("scraped_at"),
+            )
+            for article in articles
+        ]
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO articles({', '.join(ARTICLE_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+
+    def latest_scrape(self) -> Optional[str]:
+        """Return the most recent scraped_at timestamp, if any."""
+        with self._lock:
+            return self._conn.execute("SELECT MAX(scraped_at) FROM articles").fetchone()[0]
+
+    def mark_scrape_done(self, scraped_at: str, article_count: int) -> None:
+        """Record that the scrape stamped scraped_at has written all its articles."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scrapes(scraped_at, article_count) VALUES (?, ?)",
+                (scraped_at, article_count)
+            )
+
+    def latest_completed_scrape(self) -> Optional[str]:
+        """Return the scraped_at timestamp of the most recent finished scrape, if any.
+
+        Unlike latest_scrape, this never points at a scrape whose batches are
+        still being written.
+        """
+        with self._lock:
+            return self._conn.execute("SELECT MAX(scraped_at) FROM scrapes").fetchone()[0]
+
+    def latest_completed_scrape_stats(self) -> Tuple[Optional[str], int]:
+        """Return (scraped_at, article_count) of the most recent finished scrape, or (None, 0)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT scraped_at, article_count FROM scrapes ORDER BY scraped_at DESC LIMIT 1"
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, 0)
+
+    def load_articles(self) -> Dict[str, dict]:
+        """Return all stored articles keyed by canonical URL."""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM articles").fetchall()
+        articles = {}
+        for canon_url, headline, standfirst, date, tags, scraped_at in rows:
+            articles[canon_url] = {
+                "headline": headline,
+                "url": canon_url,
+                "standfirst": standfirst,
+                "date": date,
+                "tags": json.loads(tags) if tags else [],
+                "scraped_at": scraped_at,
+            }
+        return articles
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
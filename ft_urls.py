@@ -0,0 +1,12 @@
+from urllib.parse import urlsplit, urlunsplit
+
+def canonicalize_url(url: str) -> str:
+    """Normalize an FT article URL so the same article always has one key.
+
+    FT articles are addressed by path alone (/content/<id>); the query only
+    carries tracking such as utm_*, segmentId or shareType, so it is dropped
+    along with the fragment and any trailing slash, and the host is
+    lowercased.
+    """
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path.rstrip('/'), '', ''))
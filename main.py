@@ -10,20 +10,23 @@ if sys.platform == 'win32':
 
 import os
 import logging
-from fastapi import FastAPI, HTTPException, Depends
+import threading
+import unicodedata
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict
 import uvicorn
 from datetime import datetime
 from dotenv import load_dotenv
-import time
+from cachetools import TTLCache
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
 
-from scraper import FTScraper
-from prioritizator import GeopoliticalPrioritizer
+from scraper import FTScraper, DriverPool
+from article_store import ArticleStore
+from ft_urls import canonicalize_url
+from prioritizator import GeopoliticalPrioritizer, Article as ScoredArticle
 
 # Setup logging
 logging.basicConfig(
@@ -38,48 +41,223 @@ load_dotenv()
 # Initialize FastAPI app
 app = FastAPI(title="FT Article Scraper")
 
-# Add CORS middleware
+# Add CORS middleware; preflight responses are cached by clients for a day
+ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "https://myiosapp.example").split(",")
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with your iOS app's domain
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
+# Compress large JSON responses (article listings) for the iOS client
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize services
 scraper = None
+driver_pool = None  # Extra Chrome sessions for scraping sections in parallel
+# WebDriver sessions are not thread-safe: anything driving scraper.driver from
+# a worker thread holds this lock for the whole page interaction
+scraper_driver_lock = threading.Lock()
 prioritizer = GeopoliticalPrioritizer()
 scheduler = AsyncIOScheduler()
 
+# Scrolls to the bottom up to 3 times, resolving early once the teaser count
+# stops growing. Runs as one execute_async_script call instead of 3 round-trips
+# with fixed sleeps in between.
+SCROLL_UNTIL_STABLE_JS = """
+const done = arguments[arguments.length - 1];
+let scrolls = 0;
+let last = -1;
+const tick = () => {
+    window.scrollTo(0, document.body.scrollHeight);
+    const count = document.querySelectorAll('article, .o-teaser').length;
+    if (++scrolls >= 3 || count === last) {
+        done(count);
+    } else {
+        last = count;
+        setTimeout(tick, 400);
+    }
+};
+tick();
+"""
+
+# World section and its subnavs
+WORLD_SECTIONS = (
+    "https://www.ft.com/world",
+    "https://www.ft.com/world/middle-east",
+    "https://www.ft.com/world/global-economy",
+    "https://www.ft.com/world/uk",
+    "https://www.ft.com/world/us",
+    "https://www.ft.com/world/asia-pacific",
+    "https://www.ft.com/world/africa",
+    "https://www.ft.com/world/americas",
+    "https://www.ft.com/world/europe",
+    "https://www.ft.com/world/emerging-markets",
+    "https://www.ft.com/world/middle-east-north-africa",
+    "https://www.ft.com/world/ukraine"
+)
+
+# Scheduled scrapes at 6 AM, 12 PM and 7 PM
+SCRAPE_TRIGGER = CronTrigger.from_crontab('0 6,12,19 * * *')
+
+# Typographic punctuation mapped to plain ASCII instead of being dropped
+PUNCTUATION_TABLE = str.maketrans({
+    '\u2018': "'", '\u2019': "'",
+    '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '-'
+})
+
+def clean_text(text: str) -> str:
+    """Clean up encoding issues in scraped text."""
+    return unicodedata.normalize('NFKC', text).translate(PUNCTUATION_TABLE)
+
+# Teaser fields are taken from the first selector (in order) with a value
+TEASER_SELECTOR = "article, .js-teaser, .o-teaser, .o-teaser--standard, .o-teaser--hero, .o-teaser--top-story"
+HEADLINE_SELECTORS = (
+    "h3",
+    ".o-teaser__heading",
+    ".js-teaser-heading-link",
+    ".o-teaser__heading a",
+    "a[data-trackable='headline']",
+    ".o-teaser__title"
+)
+URL_SELECTORS = ("a", "a[data-trackable='headline']", ".o-teaser__heading a")
+STANDFIRST_SELECTORS = (
+    ".o-teaser__standfirst",
+    ".js-teaser-standfirst",
+    "p",
+    ".o-teaser__summary",
+    ".o-teaser__description"
+)
+
+# Extracts every teaser on the page in a single WebDriver call instead of one
+# find_element round-trip per selector per teaser.
+EXTRACT_TEASERS_JS = """
+const [teaserSel, headlineSels, urlSels, standfirstSels] = arguments;
+const pick = (el, sels, get) => {
+    for (const sel of sels) {
+        const node = el.querySelector(sel);
+        const value = node && get(node);
+        if (value) return value;
+    }
+    return null;
+};
+const text = node => (node.innerText || '').trim();
+return Array.from(document.querySelectorAll(teaserSel)).map(el => ({
+    headline: pick(el, headlineSels, text),
+    url: pick(el, urlSels, node => node.href),
+    standfirst: pick(el, standfirstSels, text),
+    timestamp: pick(el, ['time'], node => node.getAttribute('datetime'))
+}));
+"""
+
 # Global variables for tracking scraping status
 last_successful_scrape = None
 last_scrape_error = None
-all_articles = []
+all_articles: Dict[str, dict] = {}  # keyed by canonical URL
+
+# Persisted copy of all_articles so a restart doesn't lose the day's scrapes
+article_store = ArticleStore()
+
+# Scheduled scraping runs in a single worker when served by several
+# (e.g. gunicorn -w N); set RUN_SCHEDULER=0 to disable it entirely
+RUN_SCHEDULER = os.getenv("RUN_SCHEDULER", "1") == "1"
+SCHEDULER_LOCK_PATH = os.path.join("scraped_data", "scheduler.lock")
+_scheduler_lock = None
+
+# Full article content fetched via /article, keyed by canonical URL
+ARTICLE_CACHE = TTLCache(maxsize=2000, ttl=3600)
+
+# Articles per store transaction when writing while a scrape is running
+WRITE_BATCH_SIZE = 100
+
+def _store_articles(articles: List["Article"], scraped_at: str) -> None:
+    """Stamp articles and add them to all_articles and the store."""
+    batch = [{**article.model_dump(), 'scraped_at': scraped_at} for article in articles]
+    all_articles.update((article_data['url'], article_data) for article_data in batch)
+    article_store.save_articles(batch)  # single transaction
+
+def _mark_scrape_done(count: int, scraped_at: str) -> None:
+    """Update the scraping status after a successful scrape."""
+    global last_successful_scrape, last_scrape_error
+    # Other workers sync on this marker, so they only reload once every
+    # batch of the scrape is in the store
+    article_store.mark_scrape_done(scraped_at, count)
+    last_successful_scrape = scraped_at
+    last_scrape_error = None
+
+def _record_batch(new_articles: List["Article"]) -> None:
+    """Stamp a freshly scraped batch and add it to all_articles and the store."""
+    current_time = datetime.now().isoformat()
+    _store_articles(new_articles, current_time)
+    _mark_scrape_done(len(new_articles), current_time)
+
+def _acquire_scheduler_lock() -> bool:
+    """Elect this worker as scheduler leader by taking an exclusive file lock."""
+    global _scheduler_lock
+    try:
+        import fcntl
+    except ImportError:
+        # No fcntl (Windows): uvicorn runs a single process there
+        return True
+    os.makedirs(os.path.dirname(SCHEDULER_LOCK_PATH), exist_ok=True)
+    lock_file = open(SCHEDULER_LOCK_PATH, "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    # Held for the lifetime of the worker; released by the OS on exit
+    _scheduler_lock = lock_file
+    return True
+
+def _sync_from_store() -> None:
+    """Pick up articles written to the store by the scheduler worker's finished scrapes."""
+    global last_successful_scrape
+    latest = article_store.latest_completed_scrape()
+    if latest and latest != last_successful_scrape:
+        all_articles.update(article_store.load_articles())
+        last_successful_scrape = latest
 
 async def scheduled_scraping():
     """Run the scraping process at scheduled times."""
-    global last_successful_scrape, last_scrape_error, all_articles
+    global last_scrape_error
     logger.info("Starting scheduled scraping")
     try:
-        if not scraper:
-            logger.info("Initializing scraper for scheduled task")
-            global scraper
-            scraper = FTScraper()
-            await scraper.initialize()
+        await asyncio.to_thread(_ensure_scraper_sync)
         
-        # Get articles
-        new_articles = await get_articles()
-        
-        # Update global variables
+        # Sections are written out as they finish while the rest are still
+        # being scraped; None marks the end of the scrape
         current_time = datetime.now().isoformat()
-        for article in new_articles:
-            article['scraped_at'] = current_time
-            all_articles.append(article)
-        
-        last_successful_scrape = current_time
-        last_scrape_error = None
-        logger.info(f"Scheduled scraping completed. Found {len(new_articles)} new articles")
+        queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+
+        async def producer():
+            try:
+                await _scrape_now(queue)
+            finally:
+                await queue.put(None)
+
+        async def writer() -> int:
+            written = 0
+            batch = []
+            while True:
+                article = await queue.get()
+                if article is None:
+                    break
+                batch.append(article)
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    _store_articles(batch, current_time)
+                    written += len(batch)
+                    batch = []
+            _store_articles(batch, current_time)
+            return written + len(batch)
+
+        _, written = await asyncio.gather(producer(), writer())
+        _mark_scrape_done(written, current_time)
+        logger.info(f"Scheduled scraping completed. Found {written} new articles")
         
     except Exception as e:
         last_scrape_error = str(e)
@@ -95,6 +273,8 @@ class ScraperConfig(BaseModel):
     password: Optional[str] = None
 
 class Article(BaseModel):
+    model_config = ConfigDict(extra='ignore', str_strip_whitespace=True, validate_assignment=False)
+
     headline: str
     url: str
     standfirst: Optional[str] = None
@@ -187,17 +367,16 @@ async def force_cleanup_scraper():
 async def get_scraping_status():
     """Get information about the last scraping run and next scheduled run."""
     try:
-        # Get next scheduled run time
-        next_run = None
-        for job in scheduler.get_jobs():
-            if job.next_run_time:
-                if next_run is None or job.next_run_time < next_run:
-                    next_run = job.next_run_time
+        # Answered from the article store and the shared schedule, so every
+        # worker reports the same, not just the one running the scheduler
+        _sync_from_store()
+        scraped_at, article_count = article_store.latest_completed_scrape_stats()
+        next_run = SCRAPE_TRIGGER.get_next_fire_time(None, datetime.now(SCRAPE_TRIGGER.timezone))
 
         return ScrapingStatus(
-            last_successful_scrape=last_successful_scrape,
+            last_successful_scrape=scraped_at,
             total_articles=len(all_articles),
-            new_articles_since_last_scrape=len([a for a in all_articles if a.get('scraped_at') == last_successful_scrape]),
+            new_articles_since_last_scrape=article_count,
             next_scheduled_scrape=next_run.isoformat() if next_run else None,
             last_scrape_error=last_scrape_error
         )
@@ -209,8 +388,9 @@ async def get_scraping_status():
 async def get_all_articles():
     """Get all articles that have been scraped."""
     try:
+        _sync_from_store()
         return ArticleList(
-            articles=all_articles,
+            articles=list(all_articles.values()),
             total_count=len(all_articles),
             last_updated=last_successful_scrape or datetime.now().isoformat()
         )
@@ -218,154 +398,176 @@ async def get_all_articles():
         logger.error(f"Error getting all articles: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/articles", response_model=List[Article])
-async def get_articles():
-    """Get list of articles from FT"""
-    if not scraper:
-        raise HTTPException(status_code=400, detail="Scraper not initialized")
-    
-    try:
-        # Define World section and its subnavs
-        world_sections = [
-            "https://www.ft.com/world",
-            "https://www.ft.com/world/middle-east",
-            "https://www.ft.com/world/global-economy",
-            "https://www.ft.com/world/uk",
-            "https://www.ft.com/world/us",
-            "https://www.ft.com/world/asia-pacific",
-            "https://www.ft.com/world/africa",
-            "https://www.ft.com/world/americas",
-            "https://www.ft.com/world/europe",
-            "https://www.ft.com/world/emerging-markets",
-            "https://www.ft.com/world/middle-east-north-africa",
-            "https://www.ft.com/world/ukraine"
-        ]
-
-        new_articles = []
-        for i, section in enumerate(world_sections, 1):
-            try:
-                logger.info(f"Scraping section {i}/{len(world_sections)}: {section}")
-                scraper.driver.get(section)
-                time.sleep(2)  # Allow dynamic content to load
-
-                # Scroll to load more content
-                for scroll in range(3):  # Scroll 3 times
-                    logger.info(f"Scrolling page {scroll + 1}/3")
-                    scraper.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1)  # Wait for content to load
-
-                # Wait for articles to load
-                logger.info("Waiting for articles to load...")
-                articles = WebDriverWait(scraper.driver, 10).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "article, .js-teaser, .o-teaser, .o-teaser--standard, .o-teaser--hero, .o-teaser--top-story"))
-                )
-                logger.info(f"Found {len(articles)} articles in {section}")
-
-                for article in articles:
-                    try:
-                        # Try different selectors for headline
-                        headline = None
-                        for selector in [
-                            "h3", 
-                            ".o-teaser__heading", 
-                            ".js-teaser-heading-link",
-                            ".o-teaser__heading a",
-                            "a[data-trackable='headline']",
-                            ".o-teaser__title"
-                        ]:
-                            try:
-                                headline = article.find_element(By.CSS_SELECTOR, selector).text
-                                if headline:
-                                    # Clean up encoding issues
-                                    headline = headline.encode('ascii', 'ignore').decode('ascii')
-                                    logger.info(f"Found headline with selector {selector}: {headline}")
-                                    break
-                            except Exception as e:
-                                logger.debug(f"Failed to find headline with selector {selector}: {str(e)}")
-                                continue
-
-                        if not headline:
-                            logger.warning("No headline found for article")
-                            continue
-
-                        # Get URL
-                        try:
-                            # Try different selectors for URL
-                            url = None
-                            for selector in ["a", "a[data-trackable='headline']", ".o-teaser__heading a"]:
-                                try:
-                                    url = article.find_element(By.CSS_SELECTOR, selector).get_attribute("href")
-                                    if url:
-                                        break
-                                except:
-                                    continue
-
-                            if not url:
-                                logger.warning("No URL found for article")
-                                continue
-
-                            logger.info(f"Found URL: {url}")
-                            if url in scraper.visited_urls:
-                                logger.info(f"Skipping duplicate URL: {url}")
-                                continue
-                        except Exception as e:
-                            logger.warning(f"Failed to get URL: {str(e)}")
-                            continue
-
-                        # Get standfirst/description
-                        standfirst = ""
-                        for selector in [
-                            ".o-teaser__standfirst", 
-                            ".js-teaser-standfirst", 
-                            "p",
-                            ".o-teaser__summary",
-                            ".o-teaser__description"
-                        ]:
-                            try:
-                                standfirst = article.find_element(By.CSS_SELECTOR, selector).text
-                                if standfirst:
-                                    # Clean up encoding issues
-                                    standfirst = standfirst.encode('ascii', 'ignore').decode('ascii')
-                                    logger.info(f"Found standfirst with selector {selector}")
-                                    break
-                            except Exception as e:
-                                logger.debug(f"Failed to find standfirst with selector {selector}: {str(e)}")
-                                continue
-
-                        # Get timestamp if available
-                        timestamp = ""
-                        try:
-                            time_elem = article.find_element(By.CSS_SELECTOR, "time")
-                            timestamp = time_elem.get_attribute("datetime")
-                            logger.info(f"Found timestamp: {timestamp}")
-                        except Exception as e:
-                            logger.debug(f"Failed to get timestamp: {str(e)}")
-
-                        article_data = Article(
-                            headline=headline,
-                            url=url,
-                            standfirst=standfirst,
-                            date=timestamp,
-                            tags=[section.split("/")[-1]]  # Use section as tag
-                        )
-
-                        new_articles.append(article_data)
-                        scraper.visited_urls.add(url)
-                        logger.info(f"Added article: {headline}")
-
-                    except Exception as e:
-                        logger.error(f"Error processing article preview: {str(e)}")
-                        continue
-
-                logger.info(f"Finished scraping section {i}/{len(world_sections)}: {section}")
-
-            except Exception as e:
-                logger.error(f"Error scraping section {section}: {str(e)}")
+def _teasers_ready(driver) -> int:
+    """Wait condition: number of teasers on the page, counted in the browser."""
+    return driver.execute_script("return document.querySelectorAll(arguments[0]).length", TEASER_SELECTOR)
+
+def _scrape_section_sync(driver, section: str) -> List[Article]:
+    """Scrape the article previews of one section with the given driver.
+
+    Runs in a worker thread; URLs are only checked against visited_urls here,
+    the caller merges results and records them so sections can run in parallel.
+    """
+    driver.get(section)
+
+    # Scroll to load more content in a single async browser call
+    teaser_count = driver.execute_async_script(SCROLL_UNTIL_STABLE_JS)
+    logger.info(f"Scrolled {section}, {teaser_count} teasers rendered")
+
+    # Wait for articles to load
+    logger.info("Waiting for articles to load...")
+    article_count = WebDriverWait(driver, 10, poll_frequency=0.25).until(_teasers_ready)
+    logger.info(f"Found {article_count} articles in {section}")
+
+    # Pull headline, URL, standfirst and timestamp of every teaser in one call
+    teasers = driver.execute_script(
+        EXTRACT_TEASERS_JS,
+        TEASER_SELECTOR,
+        HEADLINE_SELECTORS,
+        URL_SELECTORS,
+        STANDFIRST_SELECTORS
+    )
+
+    # Per-teaser logging uses lazy %-formatting so nothing is built for
+    # records the logger drops
+    section_articles = []
+    for teaser in teasers:
+        try:
+            headline = teaser.get('headline')
+            if not headline:
+                logger.warning("No headline found for article")
+                continue
+            headline = clean_text(headline)
+            logger.info("Found headline: %s", headline)
+
+            url = teaser.get('url')
+            if not url:
+                logger.warning("No URL found for article")
+                continue
+
+            url = canonicalize_url(url)
+            logger.info("Found URL: %s", url)
+            if url in scraper.visited_urls:
+                logger.info("Skipping duplicate URL: %s", url)
                 continue
 
-        # Save progress
-        scraper._save_visited_urls()
-        logger.info(f"Total new articles found: {len(new_articles)}")
+            # Get standfirst/description
+            standfirst = clean_text(teaser.get('standfirst') or "")
+
+            # Get timestamp if available
+            timestamp = teaser.get('timestamp') or ""
+
+            article_data = Article(
+                headline=headline,
+                url=url,
+                standfirst=standfirst,
+                date=timestamp,
+                tags=[section.split("/")[-1]]  # Use section as tag
+            )
+
+            section_articles.append(article_data)
+
+        except Exception as e:
+            logger.error("Error processing article preview: %s", e)
+            continue
+
+    return section_articles
+
+def _ensure_scraper_sync() -> None:
+    """Build and start the scraper if this worker has none yet.
+
+    Only the scheduler worker starts a scraper at startup; the others start
+    one on first use, so there is no Chrome session per worker.
+    """
+    global scraper
+    with scraper_driver_lock:
+        if scraper is None:
+            new_scraper = FTScraper()
+            new_scraper._sync_init()
+            scraper = new_scraper
+            logger.info("Scraper initialized on first use")
+
+def _scrape_section_with_scraper_driver(section: str) -> List[Article]:
+    """Scrape a section on the shared scraper driver, holding its lock."""
+    with scraper_driver_lock:
+        return _scrape_section_sync(scraper.driver, section)
+
+def _fetch_full_article_sync(url: str):
+    """Refresh the session and scrape one full article on the shared scraper driver."""
+    with scraper_driver_lock:
+        scraper.refresh_session_if_needed()
+        return scraper.scrape_full_article(url)
+
+async def _scrape_now(queue: Optional[asyncio.Queue] = None) -> List[Article]:
+    """Scrape every World section and return the articles not seen before.
+
+    If a queue is given, each section's new articles are also put on it as
+    soon as that section finishes.
+    """
+    new_articles = []
+
+    def collect(section_articles: List[Article]) -> List[Article]:
+        fresh = []
+        section_urls = set()
+        for article_data in section_articles:
+            if article_data.url in scraper.visited_urls or article_data.url in section_urls:
+                continue
+            fresh.append(article_data)
+            section_urls.add(article_data.url)
+            logger.info("Added article: %s", article_data.headline)
+
+        # Save progress, one batched insert per section
+        scraper.record_visited_urls(section_urls)
+        new_articles.extend(fresh)
+        return fresh
+
+    async def scrape_section(i: int, section: str) -> None:
+        try:
+            logger.info(f"Scraping section {i}/{len(WORLD_SECTIONS)}: {section}")
+            if driver_pool:
+                driver = await driver_pool.acquire()
+                try:
+                    section_articles = await asyncio.to_thread(_scrape_section_sync, driver, section)
+                finally:
+                    await driver_pool.release(driver)
+            else:
+                section_articles = await asyncio.to_thread(_scrape_section_with_scraper_driver, section)
+            logger.info(f"Finished scraping section {i}/{len(WORLD_SECTIONS)}: {section}")
+        except Exception as e:
+            logger.error(f"Error scraping section {section}: {str(e)}")
+            return
+        for article_data in collect(section_articles):
+            if queue is not None:
+                await queue.put(article_data)
+
+    # Selenium calls run in worker threads so the event loop keeps serving
+    # other requests; without a pool the single driver is used serially
+    if driver_pool:
+        await asyncio.gather(
+            *(scrape_section(i, section) for i, section in enumerate(WORLD_SECTIONS, 1))
+        )
+    else:
+        for i, section in enumerate(WORLD_SECTIONS, 1):
+            await scrape_section(i, section)
+
+    logger.info(f"Total new articles found: {len(new_articles)}")
+    return new_articles
+
+@app.get("/articles", response_model=List[Article])
+async def get_articles(refresh: bool = False):
+    """Get list of articles from FT.
+
+    Serves the articles collected by the scheduled scrapes; pass refresh=true
+    to scrape FT now and get only the newly found articles.
+    """
+    if not refresh:
+        _sync_from_store()
+        return list(all_articles.values())
+
+    try:
+        await asyncio.to_thread(_ensure_scraper_sync)
+        new_articles = await _scrape_now()
+        _record_batch(new_articles)
         return new_articles
 
     except Exception as e:
@@ -375,18 +577,20 @@ async def get_articles():
 @app.get("/article/{url:path}", response_model=Article)
 async def get_article(url: str):
     """Get full article content"""
-    if not scraper:
-        raise HTTPException(status_code=400, detail="Scraper not initialized")
-    
+    canonical_url = canonicalize_url(url)
+    cached = ARTICLE_CACHE.get(canonical_url)
+    if cached:
+        return cached
+
     try:
-        # Refresh session if needed
-        scraper.refresh_session_if_needed()
-        
-        # Get full article content
-        article_data = scraper.scrape_full_article(url)
+        await asyncio.to_thread(_ensure_scraper_sync)
+        # Refresh session if needed and get full article content, without
+        # another request or scrape using the driver in between
+        article_data = await asyncio.to_thread(_fetch_full_article_sync, url)
         if not article_data:
             raise HTTPException(status_code=404, detail="Article not found")
             
+        ARTICLE_CACHE[canonical_url] = article_data
         return article_data
     except Exception as e:
         logger.error(f"Error getting article: {str(e)}")
@@ -395,27 +599,41 @@ async def get_article(url: str):
 @app.get("/prioritized-articles", response_model=List[PrioritizedArticle])
 async def get_prioritized_articles():
     """Get a prioritized list of articles for the iOS app."""
-    if not scraper:
-        raise HTTPException(status_code=400, detail="Scraper not initialized")
-    
     try:
-        # Get all articles
-        articles = await get_articles()
+        # Use the articles collected by the scheduled scrapes
+        _sync_from_store()
+        articles = [Article.model_validate(article_data) for article_data in all_articles.values()]
         if not articles:
             return []
 
-        # Prioritize articles
-        prioritized = prioritizer.prioritize_articles(articles)
+        # Prioritize articles; the prioritizer scores its own Article type,
+        # whose original_position points back into articles
+        prioritized = prioritizer.prioritize_articles([
+            ScoredArticle(
+                title=article.headline,
+                content=article.standfirst or article.full_text or "",
+                original_position=i,
+                url=article.url,
+                summary=article.standfirst or ""
+            )
+            for i, article in enumerate(articles)
+        ])
         
         # Convert to PrioritizedArticle format
         prioritized_articles = []
-        for article in prioritized:
-            prioritized_article = PrioritizedArticle(
-                **article.dict(),
-                summary=None,
-                audio_url=None,
-                processing_status="pending"
-            )
+        for scored in prioritized:
+            article = articles[scored.original_position]
+            article_data = {**article.model_dump(), "priority_score": scored.score}
+            # Hydrate full text from articles already fetched via /article
+            cached = ARTICLE_CACHE.get(article.url)
+            if cached and not article_data.get('full_text'):
+                article_data['full_text'] = cached.get('full_text')
+            prioritized_article = PrioritizedArticle.model_validate({
+                **article_data,
+                "summary": None,
+                "audio_url": None,
+                "processing_status": "pending"
+            })
             prioritized_articles.append(prioritized_article)
 
         return prioritized_articles
@@ -444,36 +662,49 @@ async def update_article_status(article_url: str, status: str, summary: Optional
 @app.on_event("startup")
 async def startup_event():
     """Initialize services and start scheduler on startup."""
-    global scraper, scheduler
+    global scraper, scheduler, driver_pool
     try:
+        # Restore articles scraped before the last restart
+        all_articles.update(article_store.load_articles())
+        logger.info(f"Loaded {len(all_articles)} stored articles")
+
+        # Only one worker runs the scheduled scrapes; the others serve what
+        # it writes to the article store and start a scraper on first use
+        if not (RUN_SCHEDULER and _acquire_scheduler_lock()):
+            logger.info("Scheduler runs in another worker, skipping")
+            return
+
         # Initialize scraper
         scraper = FTScraper()
         await scraper.initialize()
         logger.info("Scraper initialized on startup")
 
-        # Configure scheduler
-        scheduler.add_job(
-            scheduled_scraping,
-            CronTrigger(hour='6', minute='0'),  # 6 AM
-            id='morning_scrape',
-            name='Morning scraping at 6 AM'
-        )
-        scheduler.add_job(
-            scheduled_scraping,
-            CronTrigger(hour='12', minute='0'),  # 12 PM
-            id='noon_scrape',
-            name='Noon scraping at 12 PM'
-        )
+        # Initialize driver pool for parallel section scraping; without it
+        # sections are scraped one by one on the scraper's own driver
+        try:
+            driver_pool = DriverPool(size=4)
+            await driver_pool.start()
+        except Exception as e:
+            driver_pool = None
+            logger.warning(f"Driver pool unavailable, scraping sections serially: {str(e)}")
+
+        # Configure scheduler: one job for all three daily runs. Missed runs
+        # (e.g. after a restart) are coalesced into a single catch-up scrape,
+        # and only one scrape may use the shared driver at a time.
         scheduler.add_job(
             scheduled_scraping,
-            CronTrigger(hour='19', minute='0'),  # 7 PM
-            id='evening_scrape',
-            name='Evening scraping at 7 PM'
+            SCRAPE_TRIGGER,
+            id='scrape',
+            name='Scraping at 6 AM, 12 PM and 7 PM',
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=3600,
+            replace_existing=True
         )
 
         # Start the scheduler
         scheduler.start()
-        logger.info("Scheduler started with 3 daily scraping jobs")
+        logger.info("Scheduler started with 3 daily scraping runs")
 
     except Exception as e:
         logger.error(f"Failed to initialize services on startup: {str(e)}")
@@ -481,11 +712,18 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
-    global scraper, scheduler
+    global scraper, scheduler, driver_pool
     try:
         # Shutdown scheduler
-        scheduler.shutdown()
-        logger.info("Scheduler shut down")
+        if scheduler.running:
+            scheduler.shutdown()
+            logger.info("Scheduler shut down")
+
+        # Close pooled drivers
+        if driver_pool:
+            await driver_pool.close()
+            driver_pool = None
+            logger.info("Driver pool closed on shutdown")
 
         # Cleanup scraper
         if scraper:
@@ -495,4 +733,6 @@ async def shutdown_event():
         logger.error(f"Error during shutdown cleanup: {str(e)}")
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # Auto-reload is for local development only; in production run several
+    # workers under gunicorn (see Dockerfile)
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=bool(os.getenv("DEV")))
\ No newline at end of file
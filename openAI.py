@@ -3,24 +3,231 @@ OpenAI API Integration Script
 Handles text generation using OpenAI's GPT models
 """
 import os
+import asyncio
+import codecs
+import hashlib
 import logging
-import json
-from typing import Optional, List, Dict, Any
+import mmap
+import random
+import re
+import sqlite3
+import threading
+from typing import Optional, List, Dict, Any, Iterator, AsyncIterator
 import requests
+from requests.adapters import HTTPAdapter
+import httpx
+from httpx_sse import aconnect_sse
+import diskcache
+import numpy as np
+import orjson
+import tiktoken
+from cachetools import LRUCache
 from config import OPENAI_API_KEY, MAX_RETRIES, RETRY_DELAY
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Responses are cached in memory and on disk so repeat runs skip the API
+RESPONSE_CACHE_DIR = os.path.expanduser("~/.cache/openai_resp")
+# Only near-deterministic requests are cached unless a caller opts in
+CACHE_MAX_TEMPERATURE = 0.2
+
+# Semantic cache: near-duplicate prompts (e.g. syndicated stories) reuse a
+# cached response. Scores between the two thresholds are confirmed by a
+# cheap model before the cached response is used.
+SEMANTIC_CACHE_DIR = os.path.expanduser("~/.cache/openai_semantic")
+EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_HIT_THRESHOLD = 0.92
+SEMANTIC_VERIFY_THRESHOLD = 0.88
+SEMANTIC_VERIFY_MODEL = "gpt-4o-mini"
+
+# The model list changes rarely; reuse it for an hour, also across runs
+MODELS_CACHE_PATH = os.path.expanduser("~/.cache/openai_models.json")
+MODELS_CACHE_TTL = 3600
+
+# Context window (prompt + completion tokens) per model family; a model
+# name matches its longest listed prefix (e.g. "gpt-4o-2024-08-06" is
+# "gpt-4o"), and models matching none are not checked locally
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-3.5-turbo": 16385,
+    "gpt-4": 8192,
+    "gpt-4-32k": 32768,
+    "gpt-4-0125": 128000,
+    "gpt-4-1106": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4.1": 1047576,
+    "gpt-4.5": 128000,
+    "gpt-4o": 128000,
+    "gpt-4o-mini": 128000,
+}
+
+# Pause before the next request once fewer requests than this remain in the
+# current rate-limit window
+RATE_LIMIT_MIN_REMAINING = 2
+
+def retry_delay(attempt: int, headers: Optional[Any] = None) -> float:
+    """
+    Seconds to wait before retry number `attempt`
+    
+    Honors the server's Retry-After header; otherwise exponential backoff
+    with full jitter so concurrent clients don't retry in lockstep.
+    """
+    retry_after = headers.get("Retry-After") if headers is not None else None
+    try:
+        return float(retry_after) + random.uniform(0, RETRY_DELAY)
+    except (TypeError, ValueError):
+        return random.uniform(0, RETRY_DELAY * (2 ** attempt))
+
+def parse_reset_duration(value: str) -> float:
+    """Parse an x-ratelimit-reset-* value such as "1s", "6m0s" or "20ms" into seconds"""
+    units = {"h": 3600, "m": 60, "s": 1, "ms": 0.001}
+    return sum(float(amount) * units[unit] for amount, unit in re.findall(r"([\d.]+)(ms|h|m|s)", value or ""))
+
+def throttle_delay(headers: Any) -> float:
+    """Seconds to hold off further requests when the rate limit is nearly used up"""
+    try:
+        remaining = int(headers.get("x-ratelimit-remaining-requests"))
+    except (TypeError, ValueError):
+        return 0.0
+    if remaining >= RATE_LIMIT_MIN_REMAINING:
+        return 0.0
+    return parse_reset_duration(headers.get("x-ratelimit-reset-requests"))
+
+def request_context(payload: Dict[str, Any]) -> str:
+    """Hash of everything in a chat completion request but the model and user prompt"""
+    messages = payload["messages"]
+    context = {key: value for key, value in payload.items() if key not in ("model", "messages")}
+    context["system"] = [message["content"] for message in messages if message["role"] == "system"]
+    return hashlib.sha256(orjson.dumps(context, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def build_messages(prompt: str, system_prompt: Optional[str] = None) -> List[Dict[str, str]]:
+    """Chat messages for a prompt, with any fixed instructions as a leading system message"""
+    messages = [{"role": "user", "content": prompt}]
+    if system_prompt:
+        # Keeping the unchanging part first lets OpenAI reuse its cached prefix
+        messages.insert(0, {"role": "system", "content": system_prompt})
+    return messages
+
+# Tokenizers are costly to build, so keep one per model
+_encoders: Dict[str, tiktoken.Encoding] = {}
+
+def get_encoder(model: str) -> tiktoken.Encoding:
+    """Return the (cached) tokenizer for model"""
+    encoder = _encoders.get(model)
+    if encoder is None:
+        try:
+            encoder = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoder = tiktoken.get_encoding("cl100k_base")
+        _encoders[model] = encoder
+    return encoder
+
+def response_cache_key(payload: Dict[str, Any]) -> str:
+    """Key of a chat completion request in the response caches"""
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def context_window(model: str) -> Optional[int]:
+    """Context window of model by its longest prefix in MODEL_CONTEXT_WINDOWS, or None if unknown"""
+    family = max((name for name in MODEL_CONTEXT_WINDOWS if model.startswith(name)), key=len, default=None)
+    return MODEL_CONTEXT_WINDOWS[family] if family else None
+
+def check_context_window(prompt_tokens: int, max_tokens: int, model: str):
+    """Fail fast on prompts the model would reject anyway"""
+    window = context_window(model)
+    if window is not None and prompt_tokens + max_tokens > window:
+        raise ValueError(
+            f"Prompt of {prompt_tokens} tokens + max_tokens {max_tokens} exceeds the {window}-token context of {model}"
+        )
+
+class SemanticResponseCache:
+    """
+    Responses indexed by normalized prompt embedding, persisted to disk
+    
+    Entries live in one SQLite file, so adding one is a single atomic insert
+    rather than a rewrite of the whole cache. The vectors are also kept in
+    an in-memory matrix that grows by doubling.
+    """
+    
+    def __init__(self, cache_dir: str = SEMANTIC_CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(cache_dir, "entries.db"), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "id INTEGER PRIMARY KEY, prompt TEXT, model TEXT, context TEXT, response TEXT, vector BLOB)"
+        )
+        self._lock = threading.Lock()
+        self.entries: List[Dict[str, str]] = []
+        rows = []
+        for prompt, model, context, response, vector in self._conn.execute(
+            "SELECT prompt, model, context, response, vector FROM entries ORDER BY id"
+        ):
+            self.entries.append({"prompt": prompt, "model": model, "context": context, "response": response})
+            rows.append(np.frombuffer(vector, dtype=np.float32))
+        self._matrix: Optional[np.ndarray] = np.vstack(rows) if rows else None
+    
+    @property
+    def vectors(self) -> Optional[np.ndarray]:
+        """One row per entry; a view of the filled part of the matrix"""
+        if self._matrix is None:
+            return None
+        return self._matrix[:len(self.entries)]
+    
+    def search(self, vector: np.ndarray, model: str, context: str) -> tuple:
+        """
+        Return (score, entry) of the most similar cached prompt for model
+        
+        Only entries generated with the same context (see request_context)
+        are candidates; a similar prompt under other instructions or
+        parameters asked for something else.
+        """
+        with self._lock:
+            vectors = self.vectors
+            if vectors is None:
+                return 0.0, None
+            # Inner product of unit vectors is cosine similarity
+            scores = vectors @ vector
+            for i in np.argsort(scores)[::-1]:
+                entry = self.entries[i]
+                if entry["model"] == model and entry.get("context") == context:
+                    return float(scores[i]), entry
+            return 0.0, None
+    
+    def add(self, vector: np.ndarray, prompt: str, model: str, context: str, response: str):
+        """Add a response and persist it"""
+        vector = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO entries (prompt, model, context, response, vector) VALUES (?, ?, ?, ?, ?)",
+                    (prompt, model, context, response, vector.tobytes())
+                )
+            count = len(self.entries)
+            if self._matrix is None:
+                self._matrix = np.empty((16, vector.shape[0]), dtype=np.float32)
+            elif count == self._matrix.shape[0]:
+                grown = np.empty((count * 2, self._matrix.shape[1]), dtype=np.float32)
+                grown[:count] = self._matrix
+                self._matrix = grown
+            self._matrix[count] = vector
+            self.entries.append({"prompt": prompt, "model": model, "context": context, "response": response})
+
 class OpenAIClient:
     """OpenAI API client for text generation"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        semantic_cache: bool = False
+    ):
         """
         Initialize OpenAI client
         
         Args:
             api_key: OpenAI API key (defaults to environment variable)
+            semantic_cache: Also reuse responses for near-duplicate prompts
         """
         self.api_key = api_key or OPENAI_API_KEY
         if not self.api_key:
@@ -32,9 +239,50 @@ class OpenAIClient:
             "Content-Type": "application/json"
         }
         
-        print("✅ OpenAI client initialized successfully")
+        # Reuse connections (and TLS sessions) across API calls
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        self._session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=0))
+        
+        # Generated text keyed by a hash of the full request payload
+        self._cache = LRUCache(maxsize=1024)
+        self._disk_cache = diskcache.Cache(RESPONSE_CACHE_DIR)
+        self._semantic_cache = SemanticResponseCache() if semantic_cache else None
+        
+        # (fetched_at, models) from the last /models call, shared across runs
+        self._models_cache: Optional[tuple] = None
+        try:
+            with open(MODELS_CACHE_PATH, 'rb') as f:
+                cached_models = orjson.loads(f.read())
+            self._models_cache = (cached_models["fetched_at"], cached_models["models"])
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        # Monotonic time before which no request should be sent
+        self._throttle_until = 0.0
+        
         logger.info("OpenAI client initialized successfully")
     
+    def _wait_for_rate_limit(self, response: Optional[requests.Response] = None):
+        """Record the rate-limit headers of response, then wait out any throttle"""
+        if response is not None:
+            delay = throttle_delay(response.headers)
+            if delay:
+                self._throttle_until = max(self._throttle_until, time.monotonic() + delay)
+            return
+        remaining = self._throttle_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+    
+    def count_tokens(self, text: str, model: str = "gpt-3.5-turbo") -> int:
+        """Count the tokens text uses with model's tokenizer"""
+        return len(get_encoder(model).encode(text))
+    
+    def count_tokens_batch(self, texts: List[str], model: str = "gpt-3.5-turbo") -> List[int]:
+        """Count tokens for many texts, tokenizing in parallel threads"""
+        encoded = get_encoder(model).encode_batch(texts, num_threads=os.cpu_count() or 1)
+        return [len(tokens) for tokens in encoded]
+    
     def generate_text(
         self,
         prompt: str,
@@ -43,144 +291,661 @@ class OpenAIClient:
         temperature: float = 0.7,
         top_p: float = 1.0,
         frequency_penalty: float = 0.0,
-        presence_penalty: float = 0.0
+        presence_penalty: float = 0.0,
+        cache: Optional[bool] = None,
+        system_prompt: Optional[str] = None,
+        prompt_cache_key: Optional[str] = None,
+        semantic_cache: bool = True
     ) -> str:
         """
         Generate text using OpenAI API
+        
+        Responses are cached by request when temperature is at most
+        CACHE_MAX_TEMPERATURE; pass cache=True/False to override. Cached
+        requests also consult the client's semantic cache, if it has one,
+        unless semantic_cache=False.
         """
         if not prompt.strip():
             raise ValueError("Prompt cannot be empty")
         
         payload = {
             "model": model,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": build_messages(prompt, system_prompt),
             "max_tokens": max_tokens,
             "temperature": temperature,
             "top_p": top_p,
             "frequency_penalty": frequency_penalty,
             "presence_penalty": presence_penalty
         }
+        if prompt_cache_key:
+            payload["prompt_cache_key"] = prompt_cache_key
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Prompt length: %d characters", len(prompt))
+        
+        if cache is None:
+            cache = temperature <= CACHE_MAX_TEMPERATURE
+        cache_key = None
+        if cache:
+            cache_key = response_cache_key(payload)
+            cached = self._cache.get(cache_key)
+            if cached is None:
+                cached = self._disk_cache.get(cache_key)
+            if cached is not None:
+                self._cache[cache_key] = cached
+                return cached
+        
+        # Only requests that will be sent are tokenized for the check
+        if context_window(model) is not None:
+            prompt_tokens = self.count_tokens(prompt, model)
+            if system_prompt:
+                prompt_tokens += self.count_tokens(system_prompt, model)
+            check_context_window(prompt_tokens, max_tokens, model)
+        
+        embedding = None
+        if cache and semantic_cache and self._semantic_cache is not None:
+            context = request_context(payload)
+            embedding = self._embed(prompt)
+            if embedding is not None:
+                cached = self._semantic_lookup(prompt, model, context, embedding)
+                if cached is not None:
+                    return cached
         
+        generated_text = self._post_completion(orjson.dumps(payload))
+        if cache_key:
+            self._cache[cache_key] = generated_text
+            self._disk_cache.set(cache_key, generated_text)
+        if embedding is not None:
+            self._semantic_cache.add(embedding, prompt, model, context, generated_text)
+        return generated_text
+    
+    def _post_completion(self, body: bytes) -> str:
+        """POST a serialized chat completion request, retrying network errors, 429 and 5xx"""
         for attempt in range(MAX_RETRIES):
+            if attempt:
+                logger.info("Generating text (attempt %d/%d)", attempt + 1, MAX_RETRIES)
+            self._wait_for_rate_limit()
             try:
-                response = requests.post(
+                response = self._session.post(
                     f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json=payload,
+                    data=body,
                     timeout=60
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if "choices" in data and len(data["choices"]) > 0:
-                        generated_text = data["choices"][0]["message"]["content"].strip()
-                        return generated_text
-                    else:
-                        raise Exception("No valid response in API result")
-                
-                elif response.status_code == 429:
-                    time.sleep(RETRY_DELAY * 2)
-                    continue
-                elif response.status_code == 401:
-                    raise Exception("Invalid API key")
-                else:
-                    error_msg = f"API request failed with status {response.status_code}"
-                    if attempt < MAX_RETRIES - 1:
-                        time.sleep(RETRY_DELAY * (attempt + 1))
-                    else:
-                        raise Exception(error_msg)
-                        
             except requests.exceptions.RequestException as e:
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (attempt + 1))
-                else:
-                    raise Exception(f"Network error after {MAX_RETRIES} attempts: {str(e)}")
-            except Exception as e:
+                    time.sleep(retry_delay(attempt))
+                    continue
+                raise Exception(f"Network error after {MAX_RETRIES} attempts: {str(e)}")
+            self._wait_for_rate_limit(response)
+            
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                if "choices" in data and len(data["choices"]) > 0:
+                    return data["choices"][0]["message"]["content"].strip()
+                raise Exception("No valid response in API result")
+            elif response.status_code == 401:
+                raise Exception("Invalid API key")
+            elif (response.status_code == 429 or response.status_code >= 500) and attempt < MAX_RETRIES - 1:
+                time.sleep(retry_delay(attempt, response.headers))
+            else:
+                raise Exception(f"API request failed with status {response.status_code}")
+    
+    def generate_text_stream(
+        self,
+        prompt: str,
+        model: str = "gpt-3.5-turbo",
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> Iterator[str]:
+        """
+        Generate text using OpenAI API, yielding pieces as they are generated
+        
+        Lets callers (e.g. text-to-speech) start on the first sentence while
+        the rest is still being generated.
+        """
+        if not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+        
+        payload = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True
+        }
+        
+        # Only connecting is retried; once text has been yielded it can't be taken back
+        for attempt in range(MAX_RETRIES):
+            try:
+                self._wait_for_rate_limit()
+                response = self._session.post(
+                    f"{self.base_url}/chat/completions",
+                    data=orjson.dumps(payload),
+                    timeout=60,
+                    stream=True
+                )
+                self._wait_for_rate_limit(response)
+            except requests.exceptions.RequestException as e:
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (attempt + 1))
-                else:
-                    raise Exception(f"Failed to generate text after {MAX_RETRIES} attempts: {str(e)}")
+                    time.sleep(retry_delay(attempt))
+                    continue
+                raise Exception(f"Network error after {MAX_RETRIES} attempts: {str(e)}")
+            
+            if response.status_code == 200:
+                break
+            response.close()
+            if response.status_code == 401:
+                raise Exception("Invalid API key")
+            if (response.status_code == 429 or response.status_code >= 500) and attempt < MAX_RETRIES - 1:
+                time.sleep(retry_delay(attempt, response.headers))
+            else:
+                raise Exception(f"API request failed with status {response.status_code}")
+        
+        with response:
+            # Server-sent events: one "data: {...}" line per chunk
+            for line in response.iter_lines():
+                if not line.startswith(b"data: "):
+                    continue
+                data = line[6:]
+                if data == b"[DONE]":
+                    break
+                choices = orjson.loads(data).get("choices")
+                if choices:
+                    content = choices[0]["delta"].get("content")
+                    if content:
+                        yield content
+    
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Return the L2-normalized embedding of text, or None on failure"""
+        try:
+            response = self._session.post(
+                f"{self.base_url}/embeddings",
+                data=orjson.dumps({"model": EMBEDDING_MODEL, "input": text}),
+                timeout=30
+            )
+            if response.status_code != 200:
+                return None
+            vector = np.asarray(orjson.loads(response.content)["data"][0]["embedding"], dtype=np.float32)
+            return vector / np.linalg.norm(vector)
+        except Exception as e:
+            logger.warning(f"Embedding request failed: {str(e)}")
+            return None
+    
+    def _semantic_lookup(self, prompt: str, model: str, context: str, embedding: np.ndarray) -> Optional[str]:
+        """Return a cached response for a near-duplicate prompt sent with the same context, if any"""
+        score, entry = self._semantic_cache.search(embedding, model, context)
+        if entry is None or score < SEMANTIC_VERIFY_THRESHOLD:
+            return None
+        if score >= SEMANTIC_HIT_THRESHOLD:
+            return entry["response"]
+        
+        # Gray zone: ask a cheap model whether both prompts ask for the same thing
+        answer = self.generate_text(
+            prompt=f"Do these two requests ask for the same content? Answer yes or no.\n\nRequest A:\n{entry['prompt']}\n\nRequest B:\n{prompt}",
+            model=SEMANTIC_VERIFY_MODEL,
+            max_tokens=1,
+            temperature=0.0,
+            cache=False
+        )
+        return entry["response"] if answer.lower().startswith("yes") else None
+    
+    def run_batch(self, bodies: List[Dict[str, Any]], poll_interval: float = 30) -> List[Optional[str]]:
+        """
+        Run chat completion requests through the Batch API and wait for them
+        
+        Batches are billed at half the price of direct calls but complete
+        within 24 hours, so this suits offline runs. Returns the generated
+        text per request, or None where a request failed.
+        """
+        lines = [
+            orjson.dumps({"custom_id": str(i), "method": "POST", "url": "/v1/chat/completions", "body": body})
+            for i, body in enumerate(bodies)
+        ]
+        # Multipart upload: drop the session's JSON content type
+        response = self._session.post(
+            f"{self.base_url}/files",
+            headers={"Content-Type": None},
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", b"\n".join(lines))},
+            timeout=300
+        )
+        response.raise_for_status()
+        input_file_id = orjson.loads(response.content)["id"]
+        
+        response = self._session.post(
+            f"{self.base_url}/batches",
+            data=orjson.dumps({
+                "input_file_id": input_file_id,
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h"
+            }),
+            timeout=60
+        )
+        response.raise_for_status()
+        batch = orjson.loads(response.content)
+        logger.info(f"Submitted batch {batch['id']} with {len(bodies)} requests")
+        
+        while batch["status"] not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            response = self._session.get(f"{self.base_url}/batches/{batch['id']}", timeout=60)
+            response.raise_for_status()
+            batch = orjson.loads(response.content)
+        if not batch.get("output_file_id"):
+            raise Exception(f"Batch {batch['id']} ended with status {batch['status']}")
+        
+        response = self._session.get(f"{self.base_url}/files/{batch['output_file_id']}/content", timeout=300)
+        response.raise_for_status()
+        results: List[Optional[str]] = [None] * len(bodies)
+        for line in response.content.splitlines():
+            if not line:
+                continue
+            result = orjson.loads(line)
+            body = (result.get("response") or {}).get("body") or {}
+            if body.get("choices"):
+                results[int(result["custom_id"])] = body["choices"][0]["message"]["content"].strip()
+        return results
     
     def get_available_models(self) -> List[str]:
-        """Get list of available OpenAI models"""
+        """Get list of available OpenAI models (cached for MODELS_CACHE_TTL seconds)"""
+        if self._models_cache and time.time() - self._models_cache[0] < MODELS_CACHE_TTL:
+            return self._models_cache[1]
         try:
-            response = requests.get(f"{self.base_url}/models", headers=self.headers, timeout=30)
+            response = self._session.get(f"{self.base_url}/models", timeout=30)
             if response.status_code == 200:
-                data = response.json()
-                models = [model["id"] for model in data.get("data", [])]
-                return sorted(models)
+                data = orjson.loads(response.content)
+                models = sorted(model["id"] for model in data.get("data", []))
+                self._models_cache = (time.time(), models)
+                try:
+                    os.makedirs(os.path.dirname(MODELS_CACHE_PATH), exist_ok=True)
+                    with open(MODELS_CACHE_PATH, 'wb') as f:
+                        f.write(orjson.dumps({"fetched_at": self._models_cache[0], "models": models}))
+                except OSError as e:
+                    logger.warning(f"Could not save models cache: {str(e)}")
+                return models
             else:
                 return []
         except Exception as e:
             return []
+    
+    def close(self):
+        """Close the underlying HTTP session and response cache"""
+        self._session.close()
+        self._disk_cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-def read_article(file_path):
-    """Read and parse article content from a text file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    # Assuming first line is title and rest is excerpt
-    title, excerpt = content.split('\n', 1)
-    return title.strip(), excerpt.strip()
+# Shared client so connection pools and response caches last across calls
+_default_client: Optional[OpenAIClient] = None
 
-def generate_podcast_script(title, content):
-    """Generate podcast script using OpenAI API."""
-    try:
-        # Initialize the OpenAI client
-        client = OpenAIClient()
+def _get_client() -> OpenAIClient:
+    """
+    Return the shared OpenAIClient, creating it on first use
+    
+    The semantic cache is left off; callers that want near-duplicate
+    prompts to share responses create their own OpenAIClient with it.
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = OpenAIClient()
+    return _default_client
+
+class AsyncOpenAIClient:
+    """
+    Async OpenAI API client for generating many texts concurrently
+    
+    Shares OpenAIClient's on-disk response cache, so a text generated by
+    either client is reused by both.
+    """
+    
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize async OpenAI client
+        
+        Args:
+            api_key: OpenAI API key (defaults to environment variable)
+        """
+        self.api_key = api_key or OPENAI_API_KEY
+        if not self.api_key:
+            raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
         
-        prompt = f"""Write a concise, spoken-style summary suitable for audio narration. The tone should be informative, slightly conversational, use data if provided. Keep the total output under 1200 characters. Do not use introductionary words such as "headline" or "context".
+        self.base_url = "https://api.openai.com/v1"
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            },
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            timeout=60
+        )
+        
+        # Generated text keyed by a hash of the full request payload
+        self._cache = LRUCache(maxsize=1024)
+        self._disk_cache = diskcache.Cache(RESPONSE_CACHE_DIR)
+        
+        # Event-loop time before which no request should be sent
+        self._throttle_until = 0.0
+    
+    async def _one(self, prompt: str, system_prompt: Optional[str] = None, cache: bool = False, **params: Any) -> str:
+        """Generate text for a single prompt, from the response cache if cache is set"""
+        payload = {"messages": build_messages(prompt, system_prompt), **params}
+        cache_key = None
+        if cache:
+            cache_key = response_cache_key(payload)
+            cached = self._cache.get(cache_key)
+            if cached is None:
+                cached = self._disk_cache.get(cache_key)
+            if cached is not None:
+                self._cache[cache_key] = cached
+                return cached
+        
+        generated_text = await self._post_completion(orjson.dumps(payload))
+        if cache_key:
+            self._cache[cache_key] = generated_text
+            self._disk_cache.set(cache_key, generated_text)
+        return generated_text
+    
+    async def _post_completion(self, body: bytes) -> str:
+        """POST a serialized chat completion request, backing off on 429/5xx"""
+        loop = asyncio.get_running_loop()
+        for attempt in range(MAX_RETRIES):
+            remaining = self._throttle_until - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+            try:
+                response = await self._client.post(f"{self.base_url}/chat/completions", content=body)
+            except httpx.HTTPError as e:
+                if attempt < MAX_RETRIES - 1:
+                    await asyncio.sleep(retry_delay(attempt))
+                    continue
+                raise Exception(f"Network error after {MAX_RETRIES} attempts: {str(e)}")
+            
+            delay = throttle_delay(response.headers)
+            if delay:
+                self._throttle_until = max(self._throttle_until, loop.time() + delay)
+            
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                if "choices" in data and len(data["choices"]) > 0:
+                    return data["choices"][0]["message"]["content"].strip()
+                raise Exception("No valid response in API result")
+            elif response.status_code == 401:
+                raise Exception("Invalid API key")
+            elif (response.status_code == 429 or response.status_code >= 500) and attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(retry_delay(attempt, response.headers))
+            else:
+                raise Exception(f"API request failed with status {response.status_code}")
+    
+    async def generate_text_batch(
+        self,
+        prompts: List[str],
+        concurrency: int = 16,
+        model: str = "gpt-3.5-turbo",
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None,
+        prompt_cache_key: Optional[str] = None,
+        cache: Optional[bool] = None
+    ) -> List[Optional[str]]:
+        """
+        Generate text for each prompt, running up to `concurrency` requests at once
+        
+        Results are returned in the same order as the prompts, with None
+        where a prompt failed, so one failure doesn't discard the rest. Caching
+        follows OpenAIClient.generate_text, and every prompt is checked
+        against the model's context window before any request is sent.
+        """
+        # Tokenize off the event loop, all prompts at once
+        if context_window(model) is not None:
+            encoder = get_encoder(model)
+            prompt_tokens = await asyncio.to_thread(
+                encoder.encode_batch, prompts, num_threads=os.cpu_count() or 1
+            )
+            system_tokens = len(encoder.encode(system_prompt)) if system_prompt else 0
+            for tokens in prompt_tokens:
+                check_context_window(len(tokens) + system_tokens, max_tokens, model)
+        
+        if cache is None:
+            cache = temperature <= CACHE_MAX_TEMPERATURE
+        semaphore = asyncio.Semaphore(concurrency)
+        # The same body OpenAIClient.generate_text sends, so both clients
+        # find each other's cached responses
+        params = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": 1.0,
+            "frequency_penalty": 0.0,
+            "presence_penalty": 0.0
+        }
+        if prompt_cache_key:
+            params["prompt_cache_key"] = prompt_cache_key
+        
+        async def limited(prompt: str) -> str:
+            async with semaphore:
+                return await self._one(prompt, system_prompt=system_prompt, cache=cache, **params)
+        
+        results = await asyncio.gather(*[limited(prompt) for prompt in prompts], return_exceptions=True)
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.error("Prompt %d failed: %s", index, result)
+                results[index] = None
+        return results
+    
+    async def generate_text_stream(
+        self,
+        prompt: str,
+        model: str = "gpt-3.5-turbo",
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Generate text for a prompt, yielding pieces as they are generated"""
+        payload = {
+            "model": model,
+            "messages": build_messages(prompt, system_prompt),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True
+        }
+        body = orjson.dumps(payload)
+        loop = asyncio.get_running_loop()
+        
+        # Only connecting is retried; once text has been yielded it can't be taken back
+        for attempt in range(MAX_RETRIES):
+            remaining = self._throttle_until - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+            streaming = False
+            try:
+                async with aconnect_sse(
+                    self._client, "POST", f"{self.base_url}/chat/completions", content=body
+                ) as event_source:
+                    response = event_source.response
+                    delay = throttle_delay(response.headers)
+                    if delay:
+                        self._throttle_until = max(self._throttle_until, loop.time() + delay)
+                    if response.status_code == 200:
+                        streaming = True
+                        async for event in event_source.aiter_sse():
+                            if event.data == "[DONE]":
+                                break
+                            choices = orjson.loads(event.data).get("choices")
+                            if choices:
+                                content = choices[0]["delta"].get("content")
+                                if content:
+                                    yield content
+                        return
+            except httpx.HTTPError as e:
+                if streaming:
+                    raise
+                if attempt < MAX_RETRIES - 1:
+                    await asyncio.sleep(retry_delay(attempt))
+                    continue
+                raise Exception(f"Network error after {MAX_RETRIES} attempts: {str(e)}")
+            
+            if response.status_code == 401:
+                raise Exception("Invalid API key")
+            elif (response.status_code == 429 or response.status_code >= 500) and attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(retry_delay(attempt, response.headers))
+            else:
+                raise Exception(f"API request failed with status {response.status_code}")
+    
+    async def aclose(self):
+        """Close the underlying HTTP client and the disk cache"""
+        await self._client.aclose()
+        self._disk_cache.close()
+
+def read_article(file_path):
+    """Read and parse article content from a text file."""
+    # Memory-map the file and decode the title and excerpt straight from it
+    # through memoryview slices, which (unlike slicing the mmap) copy nothing
+    with open(file_path, 'rb') as f:
+        # An empty file can't be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return "", ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            # Assuming first line is title and rest is excerpt
+            newline = mm.find(b'\n')
+            if newline == -1:
+                return codecs.decode(view, 'utf-8', 'replace').strip(), ""
+            title = codecs.decode(view[:newline], 'utf-8', 'replace').strip()
+            excerpt = codecs.decode(view[newline + 1:], 'utf-8', 'replace').strip()
+    return title, excerpt
 
-Article Title: {title}
-Article Content: {content}
+# Same for every article, so it is sent as the system message ahead of the
+# article and never changed between calls
+PODCAST_INSTRUCTIONS = """Write a concise, spoken-style summary of the article you are given, suitable for audio narration. The tone should be informative, slightly conversational, use data if provided. Keep the total output under 1200 characters. Do not use introductionary words such as "headline" or "context".
 
 Structure:
 - Brief headline rephrasing (1 sentence).
 - Context (1–2 sentences).
 - Main point breakdown (2–4 sentences).
 - Possible consequences (1 sentence)."""
+PODCAST_PROMPT_CACHE_KEY = "podcast-script-v1"
+
+def build_podcast_prompt(title, content):
+    """Build the per-article part of the podcast script prompt."""
+    return f"""Article Title: {title}
+Article Content: {content}"""
+
+def generate_podcast_script(title, content):
+    """Generate podcast script using OpenAI API."""
+    try:
+        # Get the shared OpenAI client
+        client = _get_client()
+        
+        prompt = build_podcast_prompt(title, content)
 
         script = client.generate_text(
             prompt=prompt,
             model="gpt-3.5-turbo",
             max_tokens=300,
-            temperature=0.7
+            temperature=0.7,
+            cache=True,  # one script per article is enough
+            system_prompt=PODCAST_INSTRUCTIONS,
+            prompt_cache_key=PODCAST_PROMPT_CACHE_KEY,
+            # Similar articles still need their own script
+            semantic_cache=False
         )
         
-        logger.info(f"Generated script for article: {title[:50]}...")
+        logger.info("Generated script for article: %.50s...", title)
         return script
 
     except Exception as e:
         logger.error(f"Error generating script: {str(e)}")
         raise
 
+async def generate_podcast_scripts(articles, concurrency=16):
+    """Generate podcast scripts for many (title, content) pairs concurrently, None where one failed."""
+    client = AsyncOpenAIClient()
+    try:
+        prompts = [build_podcast_prompt(title, content) for title, content in articles]
+        return await client.generate_text_batch(
+            prompts,
+            concurrency=concurrency,
+            max_tokens=300,
+            system_prompt=PODCAST_INSTRUCTIONS,
+            prompt_cache_key=PODCAST_PROMPT_CACHE_KEY,
+            cache=True  # one script per article is enough
+        )
+    finally:
+        await client.aclose()
+
+def generate_podcast_scripts_batch(articles):
+    """Generate podcast scripts for many (title, content) pairs with the Batch API."""
+    bodies = [
+        {
+            "model": "gpt-3.5-turbo",
+            "messages": build_messages(build_podcast_prompt(title, content), PODCAST_INSTRUCTIONS),
+            "max_tokens": 300,
+            "temperature": 0.7,
+            "prompt_cache_key": PODCAST_PROMPT_CACHE_KEY
+        }
+        for title, content in articles
+    ]
+    return _get_client().run_batch(bodies)
+
+def iter_articles(root="scraped_articles"):
+    """Yield the paths of article text files in root as the directory is read."""
+    try:
+        it = os.scandir(root)
+    except FileNotFoundError:
+        # Nothing has been scraped yet
+        return
+    with it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(".txt"):
+                yield entry.path
+
+def read_article_file(file_path):
+    """Read an article, returning its path along with its title and excerpt."""
+    return file_path, read_article(file_path)
+
+def save_script(script_file, script):
+    """Write a generated script to a file."""
+    with open(script_file, "w", encoding="utf-8") as f:
+        f.write(script)
+    return script_file
+
 def main():
-    # Process only the first article file
-    article_files = glob.glob("scraped_articles/*.txt")
-    if not article_files:
+    # Read and parse articles across processes as the directory is listed
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        parsed = list(pool.map(read_article_file, iter_articles(), chunksize=8))
+    if not parsed:
         print("No article files found in scraped_articles directory")
         return
 
-    article_file = article_files[0]
-    print(f"Processing test article: {article_file}")
-
-    # Read article
-    title, excerpt = read_article(article_file)
+    article_files = [file_path for file_path, _ in parsed]
+    articles = [article for _, article in parsed]
+    print(f"Processing {len(article_files)} articles")
 
-    # Generate podcast script
+    # Generate podcast scripts, several requests in flight at once, or with
+    # --batch through the cheaper (but slower) Batch API
     try:
-        script = generate_podcast_script(title, excerpt)
-        print("\nGenerated script:")
-        print("-"*30)
-        print(script)
-        print("-"*30)
-        print(f"Character count: {len(script)}")
-
-        # Save the script to a file
-        with open("generated_script.txt", "w", encoding="utf-8") as f:
-            f.write(script)
-        print("\nScript saved to generated_script.txt")
+        if "--batch" in sys.argv[1:]:
+            scripts = generate_podcast_scripts_batch(articles)
+        else:
+            scripts = asyncio.run(generate_podcast_scripts(articles))
     except Exception as e:
-        print(f"Error generating script: {str(e)}")
+        print(f"Error generating scripts: {str(e)}")
+        return
+
+    # Skip articles no script could be generated for
+    generated = [(article_file, script) for article_file, script in zip(article_files, scripts) if script is not None]
+    article_files = [article_file for article_file, _ in generated]
+    scripts = [script for _, script in generated]
+
+    # Save each script next to the others, named after its article file
+    os.makedirs("generated_scripts", exist_ok=True)
+    script_files = [os.path.join("generated_scripts", os.path.basename(article_file)) for article_file in article_files]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for script_file, script in zip(pool.map(save_script, script_files, scripts, chunksize=8), scripts):
+            print(f"Saved {script_file} ({len(script)} characters)")
 
 if __name__ == "__main__":
     main()
@@ -1,13 +1,33 @@
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from typing import List, Dict, Iterable, Tuple, Optional
 import re
+import codecs
 from collections import defaultdict
+from functools import lru_cache
+from hashlib import blake2b
 import os
+import mmap
+import heapq
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import ahocorasick
+import numpy as np
+from cachetools import LRUCache
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Below this many articles, starting worker processes costs more than the
+# keyword scan they would parallelize
+PARALLEL_MIN_ARTICLES = 256
+
+# Keyword hit rows remembered per prioritizer, keyed by a hash of the text
+HIT_CACHE_SIZE = 10000
+
+def _is_word_char(char: str) -> bool:
+    """Whether char is part of a word, as for the regex \\w class."""
+    return char.isalnum() or char == "_"
+
+@dataclass(slots=True)
 class Article:
     title: str
     content: str
@@ -15,216 +35,285 @@ class Article:
     url: str = ""
     summary: str = ""
     score: float = 0.0
+    source_path: str = ""
+    # Set when content was cut to a PREVIEW_CHARS preview
+    truncated: bool = False
+
+    def load_content(self) -> str:
+        """Return the full content, re-reading the source file if only a preview is kept."""
+        if not (self.truncated and self.source_path):
+            return self.content
+        return _parse_article_file(self.source_path)[3]
+
+# Categories and their keywords
+CATEGORIES = {
+    "Military": {
+        "weight": 1.0,
+        "keywords": [
+            # General military terms
+            "military", "defense", "armed forces", "security", "militia", "militant", "defence",
+            # Conflict and warfare
+            "war", "conflict", "combat", "battle", "hostilities", "invasion", "attack", "strike",
+            "operation", "troop movements", "cyberwarfare", "cyber warfare",
+            # Military branches and personnel
+            "army", "navy", "air force", "troops", "soldiers", "soldier",
+            # Weapons and equipment
+            "weapon", "weapons", "missile", "missiles", "tank", "tanks", "artillery", "howitzer",
+            "drone", "drones", "unmanned aerial vehicle", "UAV", "fighter jet", "helicopter",
+            "submarine", "anti-aircraft gun", "anti-tank missile", "guided missile",
+            # Specific weapons
+            "rifle", "assault rifle", "AK-47", "M16", "sniper rifle", "machine gun", "grenade",
+            "rocket launcher", "bazooka", "pistol", "handgun", "carbine", "machine pistol",
+            # Advanced weapons
+            "nuclear weapon", "chemical weapon", "biological weapon", "explosive", "cluster bomb",
+            "landmine", "bomb", "torpedo", "surface-to-air missile", "SAM", "intercontinental ballistic missile",
+            "ICBM", "grenade launcher",
+            # Intelligence
+            "spy", "sping", "intelligence", "secret service", "cia", "mi6", "nato",
+            # Countries of interest
+            "italy", "italia", "italian", "taiwan", "palestine", "gaza", "fed"
+        ]
+    },
+    "Energy": {
+        "weight": 0.9,
+        "keywords": [
+            # General energy terms
+            "energy", "power", "electricity", "electric grid", "energy security", "energy supply",
+            "energy crisis", "energy prices", "energy independence",
+            # Energy sources
+            "oil", "gas", "natural gas", "fossil fuel", "fossil fuels", "coal", "nuclear",
+            "renewable", "solar", "wind power", "hydropower",
+            # Infrastructure
+            "pipeline", "power plant", "refinery", "drilling",
+            # Organizations and companies
+            "OPEC", "ExxonMobil", "Chevron", "BP", "Shell", "TotalEnergies", "Gazprom",
+            "Saudi Aramco", "PetroChina", "Rosneft", "Equinor", "CNOOC", "Repsol"
+        ]
+    },
+    "Food & Mineral Supply": {
+        "weight": 0.8,
+        "keywords": [
+            # Food security
+            "wheat", "grain", "food security", "agriculture",
+            # Minerals and resources
+            "minerals", "rare earth", "lithium", "cobalt", "nickel", "copper",
+            "natural resources", "mining",
+            # Supply chain
+            "supply chain", "commodities", "exports", "imports",
+            # Migrants
+            "migrants", "asylum",
+            # Dictators
+            "putin", "iran", "china", "russia", "israel", "netanyahu", "hizbollah", "turkey"
+        ]
+    },
+    "Tech & Innovation": {
+        "weight": 0.7,
+        "keywords": [
+            # General tech terms
+            "technology", "tech", "innovation", "R&D", "startup", "digital", "automation",
+            # AI and computing
+            "AI", "artificial intelligence", "machine learning", "quantum computing",
+            "semiconductor", "chip", "chips", "robotics", "blockchain", "big data",
+            # Infrastructure
+            "software", "hardware", "cloud computing", "cybersecurity", "data center",
+            "5G", "6G",
+            # Companies
+            "tech giants", "Intel", "AMD", "NVIDIA", "TSMC", "Qualcomm", "Samsung Electronics",
+            "IBM", "Google", "Microsoft", "Apple", "Facebook", "Meta", "Amazon", "Tesla",
+            "ASML", "Broadcom", "Micron"
+        ]
+    },
+    "Economy": {
+        "weight": 0.6,
+        "keywords": [
+            # Economic indicators
+            "GDP", "inflation", "inflation rate", "deflation", "unemployment",
+            "economic growth", "economic downturn", "economic recovery", "recession",
+            # Policy and markets
+            "fiscal policy", "monetary policy", "trade balance", "stimulus",
+            "consumer spending", "investment", "economic indicators",
+            # Industry metrics
+            "supply chain", "manufacturing output", "retail sales"
+        ]
+    },
+    "Elections & Regime Change": {
+        "weight": 0.5,
+        "keywords": [
+            # Political processes
+            "election", "vote", "ballot", "poll", "campaign", "democratic process",
+            # Government and leadership
+            "regime", "regime change", "government", "transition", "parliament",
+            "prime minister", "president", "governance",
+            # Political stability
+            "political", "political party", "political instability", "political unrest",
+            "protest", "revolution", "civil unrest", "coup", "authoritarian"
+        ]
+    },
+    "Bond Markets": {
+        "weight": 0.4,
+        "keywords": [
+            # Market terms
+            "bonds", "bond market", "yield", "yield curve", "treasury", "government bonds",
+            "corporate bonds", "junk bonds", "investment grade", "tresuries",
+            # Risk and analysis
+            "liquidity", "credit risk", "default risk", "interest rate", "bond yields",
+            "spread", "fixed income", "debt market",
+            # Market operations
+            "bond issuance", "coupon", "maturity"
+        ]
+    },
+    "Central Banks": {
+        "weight": 0.3,
+        "keywords": [
+            # General terms
+            "central bank", "monetary policy", "inflation target", "policy statement",
+            "balance sheet", "open market operations",
+            # Interest rates
+            "interest rate", "rate hike", "rate cut", "repo rate", "discount rate",
+            # Monetary operations
+            "quantitative easing", "QE", "monetary tightening",
+            # Major central banks
+            "Federal Reserve", "ECB", "Bank of England", "Bank of Japan"
+        ]
+    },
+    "Currency/Crypto/Commodity Shocks": {
+        "weight": 0.2,
+        "keywords": [
+            # Currency markets
+            "currency", "forex", "exchange rate", "foreign exchange market",
+            "currency devaluation", "USD", "EUR", "JPY", "GBP", "CNY", "CHF", "CAD", "AUD",
+            # Cryptocurrency
+            "crypto", "cryptocurrency", "bitcoin", "ethereum", "digital asset",
+            "crypto regulation", "crypto market", "Bitcoin", "Ethereum", "Ripple", "Litecoin",
+            "Cardano", "Polkadot", "Dogecoin", "Binance Coin", "Tether", "Solana",
+            # Commodities
+            "commodity", "commodities", "gold", "silver", "crude oil", "natural gas",
+            "copper", "platinum", "palladium", "commodity prices",
+            # Market conditions
+            "volatility", "hedging", "price shock", "market turbulence"
+        ]
+    },
+    "Sanctions & Trade Policy": {
+        "weight": 0.15,
+        "keywords": [
+            # Trade terms
+            "trade policy", "trade agreement", "WTO", "customs", "quota",
+            "trade war", "trade barriers", "import tariffs", "export restrictions",
+            "retaliatory tariffs", "geopolitical sanctions",
+            # Sanctions
+            "sanctions", "embargo", "export control", "import restrictions",
+            "economic sanctions", "blacklist", "economic pressure"
+        ]
+    },
+    "Diplomacy & Alliances": {
+        "weight": 0.1,
+        "keywords": [
+            # General terms
+            "diplomacy", "alliance", "coalition", "treaty", "summit", "negotiation",
+            "foreign policy", "international relations", "power bloc",
+            # Relations
+            "bilateral relations", "multilateral", "strategic partnership",
+            "diplomatic talks", "diplomatic mission", "peace talks",
+            # Organizations
+            "UN", "NATO", "G7", "G20",
+            # Personnel
+            "ambassador"
+        ]
+    },
+    "Big Tech": {
+        "weight": 0.05,
+        "keywords": [
+            # Companies
+            "big tech", "Facebook", "Meta", "Google", "Alphabet", "Apple", "Amazon",
+            "Microsoft", "Tesla", "Netflix", "Twitter", "LinkedIn", "YouTube",
+            # Services and platforms
+            "cloud services", "AI platform", "social media", "digital advertising",
+            # Regulation and privacy
+            "data privacy", "antitrust", "platform regulation"
+        ]
+    }
+}
+
+@lru_cache(maxsize=1)
+def _build_matcher() -> Tuple[List[str], List[int], np.ndarray, "ahocorasick.Automaton"]:
+    """
+    Compile every category's keywords into one Aho-Corasick automaton.
+
+    Returns the keywords (indexed by the ids the automaton reports), their
+    lengths, their weights and the automaton. Built once per process and
+    shared by all prioritizers, as CATEGORIES never changes.
+    """
+    # A keyword listed in several categories (or twice in one) scores
+    # once per listing, so keep the weight of every listing
+    listings: Dict[str, List[float]] = defaultdict(list)
+    for data in CATEGORIES.values():
+        for keyword in data["keywords"]:
+            listings[keyword.lower()].append(data["weight"])
+
+    # The automaton reports keyword ids; each id's weight is the sum of
+    # its listings
+    keywords = list(listings)
+    keyword_lengths = [len(keyword) for keyword in keywords]
+    keyword_weights = np.array([sum(listings[keyword]) for keyword in keywords], dtype=np.float64)
+    automaton = ahocorasick.Automaton()
+    for keyword_id, keyword in enumerate(keywords):
+        automaton.add_word(keyword, keyword_id)
+    automaton.make_automaton()
+    return keywords, keyword_lengths, keyword_weights, automaton
 
 class GeopoliticalPrioritizer:
     def __init__(self):
-        # Define categories and their keywords
-        self.categories = {
-            "Military": {
-                "weight": 1.0,
-                "keywords": [
-                    # General military terms
-                    "military", "defense", "armed forces", "security", "militia", "militant", "defence",
-                    # Conflict and warfare
-                    "war", "conflict", "combat", "battle", "hostilities", "invasion", "attack", "strike",
-                    "operation", "troop movements", "cyberwarfare", "cyber warfare",
-                    # Military branches and personnel
-                    "army", "navy", "air force", "troops", "soldiers", "soldier",
-                    # Weapons and equipment
-                    "weapon", "weapons", "missile", "missiles", "tank", "tanks", "artillery", "howitzer",
-                    "drone", "drones", "unmanned aerial vehicle", "UAV", "fighter jet", "helicopter",
-                    "submarine", "anti-aircraft gun", "anti-tank missile", "guided missile",
-                    # Specific weapons
-                    "rifle", "assault rifle", "AK-47", "M16", "sniper rifle", "machine gun", "grenade",
-                    "rocket launcher", "bazooka", "pistol", "handgun", "carbine", "machine pistol",
-                    # Advanced weapons
-                    "nuclear weapon", "chemical weapon", "biological weapon", "explosive", "cluster bomb",
-                    "landmine", "bomb", "torpedo", "surface-to-air missile", "SAM", "intercontinental ballistic missile",
-                    "ICBM", "grenade launcher",
-                    # Intelligence
-                    "spy", "sping", "intelligence", "secret service", "cia", "mi6", "nato"
-                    # Countries of interest
-                    "italy", "italia", "italian", "taiwan", "palestine", "gaza", "fed"
-                ]
-            },
-            "Energy": {
-                "weight": 0.9,
-                "keywords": [
-                    # General energy terms
-                    "energy", "power", "electricity", "electric grid", "energy security", "energy supply",
-                    "energy crisis", "energy prices", "energy independence",
-                    # Energy sources
-                    "oil", "gas", "natural gas", "fossil fuel", "fossil fuels", "coal", "nuclear",
-                    "renewable", "solar", "wind power", "hydropower",
-                    # Infrastructure
-                    "pipeline", "power plant", "refinery", "drilling",
-                    # Organizations and companies
-                    "OPEC", "ExxonMobil", "Chevron", "BP", "Shell", "TotalEnergies", "Gazprom",
-                    "Saudi Aramco", "PetroChina", "Rosneft", "Equinor", "CNOOC", "Repsol"
-                ]
-            },
-            "Food & Mineral Supply": {
-                "weight": 0.8,
-                "keywords": [
-                    # Food security
-                    "wheat", "grain", "food security", "agriculture",
-                    # Minerals and resources
-                    "minerals", "rare earth", "lithium", "cobalt", "nickel", "copper",
-                    "natural resources", "mining",
-                    # Supply chain
-                    "supply chain", "commodities", "exports", "imports",
-                    # Migrants
-                    "migrants", "asylum" 
-                    # Dictators
-                    "putin", "iran", "china", "russia", "israel", "netanyahu", "hizbollah", "turkey"
-                ]
-            },
-            "Tech & Innovation": {
-                "weight": 0.7,
-                "keywords": [
-                    # General tech terms
-                    "technology", "tech", "innovation", "R&D", "startup", "digital", "automation",
-                    # AI and computing
-                    "AI", "artificial intelligence", "machine learning", "quantum computing",
-                    "semiconductor", "chip", "chips", "robotics", "blockchain", "big data",
-                    # Infrastructure
-                    "software", "hardware", "cloud computing", "cybersecurity", "data center",
-                    "5G", "6G",
-                    # Companies
-                    "tech giants", "Intel", "AMD", "NVIDIA", "TSMC", "Qualcomm", "Samsung Electronics",
-                    "IBM", "Google", "Microsoft", "Apple", "Facebook", "Meta", "Amazon", "Tesla",
-                    "ASML", "Broadcom", "Micron"
-                ]
-            },
-            "Economy": {
-                "weight": 0.6,
-                "keywords": [
-                    # Economic indicators
-                    "GDP", "inflation", "inflation rate", "deflation", "unemployment",
-                    "economic growth", "economic downturn", "economic recovery", "recession",
-                    # Policy and markets
-                    "fiscal policy", "monetary policy", "trade balance", "stimulus",
-                    "consumer spending", "investment", "economic indicators",
-                    # Industry metrics
-                    "supply chain", "manufacturing output", "retail sales"
-                ]
-            },
-            "Elections & Regime Change": {
-                "weight": 0.5,
-                "keywords": [
-                    # Political processes
-                    "election", "vote", "ballot", "poll", "campaign", "democratic process",
-                    # Government and leadership
-                    "regime", "regime change", "government", "transition", "parliament",
-                    "prime minister", "president", "governance",
-                    # Political stability
-                    "political", "political party", "political instability", "political unrest",
-                    "protest", "revolution", "civil unrest", "coup", "authoritarian"
-                
-
-                ]
-            },
-            "Bond Markets": {
-                "weight": 0.4,
-                "keywords": [
-                    # Market terms
-                    "bonds", "bond market", "yield", "yield curve", "treasury", "government bonds",
-                    "corporate bonds", "junk bonds", "investment grade", "tresuries",
-                    # Risk and analysis
-                    "liquidity", "credit risk", "default risk", "interest rate", "bond yields",
-                    "spread", "fixed income", "debt market",
-                    # Market operations
-                    "bond issuance", "coupon", "maturity"
-                ]
-            },
-            "Central Banks": {
-                "weight": 0.3,
-                "keywords": [
-                    # General terms
-                    "central bank", "monetary policy", "inflation target", "policy statement",
-                    "balance sheet", "open market operations",
-                    # Interest rates
-                    "interest rate", "rate hike", "rate cut", "repo rate", "discount rate",
-                    # Monetary operations
-                    "quantitative easing", "QE", "monetary tightening",
-                    # Major central banks
-                    "Federal Reserve", "ECB", "Bank of England", "Bank of Japan"
-                ]
-            },
-            "Currency/Crypto/Commodity Shocks": {
-                "weight": 0.2,
-                "keywords": [
-                    # Currency markets
-                    "currency", "forex", "exchange rate", "foreign exchange market",
-                    "currency devaluation", "USD", "EUR", "JPY", "GBP", "CNY", "CHF", "CAD", "AUD",
-                    # Cryptocurrency
-                    "crypto", "cryptocurrency", "bitcoin", "ethereum", "digital asset",
-                    "crypto regulation", "crypto market", "Bitcoin", "Ethereum", "Ripple", "Litecoin",
-                    "Cardano", "Polkadot", "Dogecoin", "Binance Coin", "Tether", "Solana",
-                    # Commodities
-                    "commodity", "commodities", "gold", "silver", "crude oil", "natural gas",
-                    "copper", "platinum", "palladium", "commodity prices",
-                    # Market conditions
-                    "volatility", "hedging", "price shock", "market turbulence"
-                ]
-            },
-            "Sanctions & Trade Policy": {
-                "weight": 0.15,
-                "keywords": [
-                    # Trade terms
-                    "trade policy", "trade agreement", "WTO", "customs", "quota",
-                    "trade war", "trade barriers", "import tariffs", "export restrictions",
-                    "retaliatory tariffs", "geopolitical sanctions",
-                    # Sanctions
-                    "sanctions", "embargo", "export control", "import restrictions",
-                    "economic sanctions", "blacklist", "economic pressure"
-                ]
-            },
-            "Diplomacy & Alliances": {
-                "weight": 0.1,
-                "keywords": [
-                    # General terms
-                    "diplomacy", "alliance", "coalition", "treaty", "summit", "negotiation",
-                    "foreign policy", "international relations", "power bloc",
-                    # Relations
-                    "bilateral relations", "multilateral", "strategic partnership",
-                    "diplomatic talks", "diplomatic mission", "peace talks",
-                    # Organizations
-                    "UN", "NATO", "G7", "G20",
-                    # Personnel
-                    "ambassador"
-                ]
-            },
-            "Big Tech": {
-                "weight": 0.05,
-                "keywords": [
-                    # Companies
-                    "big tech", "Facebook", "Meta", "Google", "Alphabet", "Apple", "Amazon",
-                    "Microsoft", "Tesla", "Netflix", "Twitter", "LinkedIn", "YouTube",
-                    # Services and platforms
-                    "cloud services", "AI platform", "social media", "digital advertising",
-                    # Regulation and privacy
-                    "data privacy", "antitrust", "platform regulation"
-                ]
-            }
-        }
-
-    def _count_keyword_matches(self, text: str, keywords: List[str]) -> int:
-        """Count how many keywords appear in the text."""
-        text = text.lower()
-        return sum(1 for keyword in keywords if keyword.lower() in text)
-
-    def _calculate_keyword_score(self, article: Article) -> float:
-        """Calculate score based on keyword matches."""
-        total_score = 0.0
-        for category, data in self.categories.items():
-            keyword_matches = self._count_keyword_matches(
-                f"{article.title} {article.content}",
-                data["keywords"]
-            )
-            category_score = keyword_matches * data["weight"]
-            total_score += category_score
-        return total_score
+        self.categories = CATEGORIES
+        self._keywords, self._keyword_lengths, self._keyword_weights, self._automaton = _build_matcher()
+        # Unchanged articles are rescored on every request, so remember their
+        # keyword hits by content hash
+        self._hit_cache: LRUCache = LRUCache(maxsize=HIT_CACHE_SIZE)
+
+    def _mark_keyword_hits(self, text: str, hits: np.ndarray):
+        """Set hits[keyword_id] for every keyword found in the lowercased text."""
+        # One pass over the text finds every keyword occurrence; each keyword
+        # counts once per article, however often it appears. Only whole-word
+        # occurrences count ("war" must not match "warming").
+        last = len(text) - 1
+        for end, keyword_id in self._automaton.iter(text):
+            if hits[keyword_id]:
+                continue
+            start = end - self._keyword_lengths[keyword_id] + 1
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if end < last and _is_word_char(text[end + 1]):
+                continue
+            hits[keyword_id] = 1
+
+    def keyword_hits(self, texts: List[str]) -> np.ndarray:
+        """Return the (texts x keywords) hit matrix for lowercased texts."""
+        hits = np.zeros((len(texts), len(self._keywords)), dtype=np.uint8)
+        for i, text in enumerate(texts):
+            self._mark_keyword_hits(text, hits[i])
+        return hits
+
+    def _cached_keyword_hits(self, texts: List[str]) -> np.ndarray:
+        """Return the hit matrix for lowercased texts, scanning only texts not seen before."""
+        hits = np.empty((len(texts), len(self._keywords)), dtype=np.uint8)
+        keys = [blake2b(text.encode('utf-8'), digest_size=16).digest() for text in texts]
+        missing = []
+        for i, key in enumerate(keys):
+            row = self._hit_cache.get(key)
+            if row is None:
+                missing.append(i)
+            else:
+                hits[i] = np.frombuffer(row, dtype=np.uint8)
+
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            if len(missing_texts) >= PARALLEL_MIN_ARTICLES:
+                missing_hits = _keyword_hits_parallel(missing_texts)
+            else:
+                missing_hits = self.keyword_hits(missing_texts)
+            hits[missing] = missing_hits
+            for i, row in zip(missing, missing_hits):
+                self._hit_cache[keys[i]] = row.tobytes()
+        return hits
 
     def _calculate_source_score(self, article: Article) -> float:
         """Calculate source score based on article source."""
@@ -241,40 +330,72 @@ class GeopoliticalPrioritizer:
         # This method needs to be implemented based on the actual implementation
         return 0.0
 
-    def prioritize_articles(self, articles: List[Article]) -> List[Article]:
-        """Prioritize articles based on various factors."""
+    def _score_articles(self, articles: List[Article], preview_only: bool = False) -> np.ndarray:
+        """Set and return the final score of each article."""
+        total_articles = len(articles)
+
+        # Keyword hits for all articles as one (articles x keywords) matrix,
+        # so base scores are a single matrix-vector product
+        texts = [f"{article.title} {article.content}".lower() for article in articles]
+        hits = self._cached_keyword_hits(texts)
+        del texts
+        base_scores = hits.astype(np.float64) @ self._keyword_weights
+
+        # Calculate source, topic and length scores, on the full content
+        source_scores = np.fromiter((self._calculate_source_score(a) for a in articles), dtype=np.float64, count=total_articles)
+        topic_scores = np.fromiter((self._calculate_topic_score(a) for a in articles), dtype=np.float64, count=total_articles)
+        length_scores = np.fromiter((self._calculate_length_score(a) for a in articles), dtype=np.float64, count=total_articles)
+
+        if preview_only:
+            # Let the full texts be freed before sorting
+            for article in articles:
+                if len(article.content) > PREVIEW_CHARS:
+                    article.content = article.content[:PREVIEW_CHARS]
+                    article.truncated = True
+
+        # Calculate final scores with weights (adjusted to remove recency)
+        final_scores = (
+            base_scores * 0.4 +  # Increased from 0.3 to 0.4
+            source_scores * 0.25 +  # Increased from 0.2 to 0.25
+            topic_scores * 0.2 +  # Increased from 0.15 to 0.2
+            length_scores * 0.15  # Increased from 0.1 to 0.15
+        )
+
+        for article, final_score in zip(articles, final_scores.tolist()):
+            article.score = final_score
+            logger.debug("Article '%s' scored %.2f", article.title, final_score)
+
+        return final_scores
+
+    def prioritize_articles(
+        self,
+        articles: List[Article],
+        top_k: Optional[int] = None,
+        preview_only: bool = False
+    ) -> List[Article]:
+        """
+        Prioritize articles based on various factors, keeping only the top_k if given.
+
+        With preview_only, each article's content is cut to its first
+        PREVIEW_CHARS characters once scored; Article.load_content() re-reads
+        the full text from its source file.
+        """
         if not articles:
             return []
 
         total_articles = len(articles)
         logger.info(f"Prioritizing {total_articles} articles")
 
-        for i, article in enumerate(articles):
-            # Calculate base score from keywords
-            base_score = self._calculate_keyword_score(article)
-            
-            # Calculate source score
-            source_score = self._calculate_source_score(article)
-            
-            # Calculate topic score
-            topic_score = self._calculate_topic_score(article)
-            
-            # Calculate length score
-            length_score = self._calculate_length_score(article)
-            
-            # Calculate final score with weights (adjusted to remove recency)
-            final_score = (
-                base_score * 0.4 +  # Increased from 0.3 to 0.4
-                source_score * 0.25 +  # Increased from 0.2 to 0.25
-                topic_score * 0.2 +  # Increased from 0.15 to 0.2
-                length_score * 0.15  # Increased from 0.1 to 0.15
-            )
-            
-            article.score = final_score
-            logger.debug(f"Article '{article.title}' scored {final_score:.2f}")
+        final_scores = self._score_articles(articles, preview_only)
+        scores = final_scores.tolist()
 
-        # Sort articles by score in descending order
-        sorted_articles = sorted(articles, key=lambda x: x.score, reverse=True)
+        # Sort articles by score in descending order (stable, so ties keep
+        # their original order); for the top_k only a heap of k is needed
+        if top_k is not None and top_k < total_articles:
+            order = heapq.nlargest(top_k, range(total_articles), key=scores.__getitem__)
+        else:
+            order = np.argsort(-final_scores, kind="stable")
+        sorted_articles = [articles[i] for i in order]
         
         # Log all articles with their scores
         logger.info("\nAll articles by priority:")
@@ -283,6 +404,93 @@ class GeopoliticalPrioritizer:
         
         return sorted_articles
 
+    def score_one(self, article: Article) -> float:
+        """Score a single article, e.g. as soon as it is scraped."""
+        return float(self._score_articles([article])[0])
+
+    def score_stream(self, articles: Iterable[Article], top_k: int) -> List[Article]:
+        """
+        Score articles as they arrive, keeping only the top_k best.
+
+        Each article is scored on its own and pushed into a heap of at most
+        top_k, so earlier articles are never rescanned. Returns the same
+        order prioritize_articles(articles, top_k) would.
+        """
+        if top_k <= 0:
+            return []
+        # Min-heap on (score, -index): the weakest entry, and among equal
+        # scores the latest one, is evicted first
+        heap: List[Tuple[float, int, Article]] = []
+        for index, article in enumerate(articles):
+            entry = (self.score_one(article), -index, article)
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+        return [article for _, _, article in sorted(heap, reverse=True)]
+
+# Line separating an article file's header block from its body
+ARTICLE_SEPARATOR = '=' * 50
+
+# Header lines ("Title: ...", "URL: ...", "Summary: ...") above the separator
+HEADER_RE = re.compile(r'(Title|URL|Summary): (.*)')
+
+# Article file names and their position number (e.g. "article_1_" -> 1);
+# priority list files are excluded
+ARTICLE_FILE_RE = re.compile(r'article_(?!priority_)')
+POSITION_RE = re.compile(r'article_(\d+)_')
+
+# Characters of content kept per article when only a preview is needed
+PREVIEW_CHARS = 200
+
+def _parse_article_file(file_path: str) -> Tuple[str, str, str, str]:
+    """Read an article file, returning its title, URL, summary and content."""
+    # Map the file and decode it straight from the mapping through a
+    # memoryview, without first copying it into a bytes object as a read
+    # (or slicing the mmap) would
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            text = ""
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                text = codecs.decode(view, 'utf-8', 'replace')
+    # The line endings a text-mode read would have produced
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+    # Extract title, URL, and summary; every other line is content, stripped,
+    # apart from the separator lines
+    headers = {}
+    content_lines = []
+    
+    for line in text.split('\n'):
+        line = line.strip()
+        match = HEADER_RE.match(line)
+        if match:
+            headers[match.group(1)] = match.group(2).strip()
+        elif line != ARTICLE_SEPARATOR:
+            content_lines.append(line)
+    
+    title, url, summary = headers.get('Title', ''), headers.get('URL', ''), headers.get('Summary', '')
+    return title, url, summary, '\n'.join(content_lines).strip()
+
+# Per-process prioritizer for parallel keyword scans
+_worker_prioritizer = None
+
+def _init_worker():
+    global _worker_prioritizer
+    _worker_prioritizer = GeopoliticalPrioritizer()
+
+def _keyword_hits_chunk(texts: List[str]) -> np.ndarray:
+    return _worker_prioritizer.keyword_hits(texts)
+
+def _keyword_hits_parallel(texts: List[str]) -> np.ndarray:
+    """Scan texts for keywords across all CPU cores."""
+    workers = os.cpu_count() or 1
+    chunk_size = -(-len(texts) // workers)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return np.vstack(list(pool.map(_keyword_hits_chunk, chunks)))
+
 def read_articles_from_folder(folder_path: str) -> List[Article]:
     """
     Read articles from the scraped_articles folder.
@@ -293,67 +501,50 @@ def read_articles_from_folder(folder_path: str) -> List[Article]:
     Returns:
         List of Article objects
     """
-    articles = []
-
-    # Get all article files and sort them by their position number
+    # Get all article files with their position number (e.g. "article_1_" -> 1)
     # Exclude priority list files and only get actual article files
-    article_files = [
-        f for f in os.listdir(folder_path) 
-        if f.startswith('article_') and not f.startswith('article_priority_')
-    ]
-    
-    # Sort files by their position number, handling potential errors
     def get_position(filename):
-        try:
-            return int(filename.split('_')[1])
-        except (IndexError, ValueError):
-            return float('inf')  # Put files with invalid positions at the end
-    
-    article_files.sort(key=get_position)
+        match = POSITION_RE.match(filename)
+        return int(match.group(1)) if match else None
+
+    with os.scandir(folder_path) as it:
+        entries = [
+            (get_position(entry.name), entry)
+            for entry in it
+            if ARTICLE_FILE_RE.match(entry.name)
+        ]
+
+    # Sort files by their position number, files with invalid positions last
+    entries.sort(key=lambda item: float('inf') if item[0] is None else item[0])
 
-    for file_name in article_files:
-        file_path = os.path.join(folder_path, file_name)
+    def load(indexed_entry):
+        index, (file_position, entry) = indexed_entry
+        file_name = entry.name
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Extract title, URL, and summary
-            lines = content.split('\n')
-            title = ""
-            url = ""
-            summary = ""
-            content_lines = []
-            
-            for line in lines:
-                line = line.strip()
-                if line.startswith('Title: '):
-                    title = line[7:].strip()
-                elif line.startswith('URL: '):
-                    url = line[5:].strip()
-                elif line.startswith('Summary: '):
-                    summary = line[9:].strip()
-                elif line != '='*50:  # Skip the separator line
-                    content_lines.append(line)
-            
-            article_content = '\n'.join(content_lines).strip()
-
-            # Extract position from filename (e.g., "article_1_" -> 1)
-            try:
-                position = int(file_name.split('_')[1])
-            except (IndexError, ValueError):
+            title, url, summary, article_content = _parse_article_file(entry.path)
+
+            position = file_position
+            if position is None:
                 logger.warning(f"Could not extract position from filename: {file_name}")
-                position = len(articles) + 1
+                position = index + 1
 
-            articles.append(Article(
+            return Article(
                 title=title,
                 content=article_content,
                 original_position=position,
                 url=url,
-                summary=summary
-            ))
+                summary=summary,
+                source_path=entry.path
+            )
 
         except Exception as e:
             logger.error(f"Error reading file {file_name}: {str(e)}")
+            return None
+
+    # Reading is I/O-bound, so overlap the reads in threads; map keeps the
+    # sorted order
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        articles = [article for article in executor.map(load, enumerate(entries)) if article is not None]
 
     return articles
 
@@ -368,8 +559,8 @@ def main():
         print("No articles found in the scraped_articles folder.")
         return
 
-    # Prioritize articles
-    ranked_articles = prioritizer.prioritize_articles(articles)
+    # Prioritize articles; only a preview of each is printed
+    ranked_articles = prioritizer.prioritize_articles(articles, preview_only=True)
 
     # Print results
     print("\nRanked Articles by Geopolitical Priority:")
@@ -378,7 +569,7 @@ def main():
         print(f"\n{i}. Score: {article.score:.2f}")
         print(f"Title: {article.title}")
         print(f"Original Position: {article.original_position}")
-        print(f"Content Preview: {article.content[:200]}...")
+        print(f"Content Preview: {article.content}{'...' if article.truncated else ''}")
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,8 @@
 import os
 import logging
 import time
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Iterable
 from datetime import datetime
-from playwright.async_api import async_playwright, Page, Browser
 from dotenv import load_dotenv
 import json
 from pathlib import Path
@@ -11,15 +10,18 @@ from logging.handlers import RotatingFileHandler
 import glob
 import sys
 import asyncio
+import atexit
+import threading
 import concurrent.futures
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import random
 
+from article_store import ArticleStore
+
 # Create logs directory if it doesn't exist
 LOGS_DIR = "logs"
 os.makedirs(LOGS_DIR, exist_ok=True)
@@ -43,11 +45,16 @@ def setup_logging():
     )
     file_handler.setFormatter(formatter)
     
-    # Setup root logger
+    # Setup root logger; DEBUG is opt-in via LOG_LEVEL
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
     root_logger.addHandler(console_handler)
     root_logger.addHandler(file_handler)
+
+    # Selenium and urllib3 log every WebDriver command and its JSON payload
+    # at DEBUG
+    logging.getLogger('selenium').setLevel(logging.WARNING)
+    logging.getLogger('urllib3').setLevel(logging.WARNING)
     
     # Clean up old pipeline logs
     cleanup_old_logs()
@@ -78,9 +85,157 @@ logger = logging.getLogger(__name__)
 # Load environment variables from .env file
 logger.debug("Loading .env file...")
 load_dotenv()
-logger.debug(f"Current working directory: {os.getcwd()}")
-logger.debug(f"FT_USERNAME from env: {os.getenv('FT_USERNAME')}")
-logger.debug(f"FT_PASSWORD from env: {os.getenv('FT_PASSWORD')}")
+logger.debug("Current working directory: %s", os.getcwd())
+logger.debug("FT_USERNAME set: %s", bool(os.getenv('FT_USERNAME')))
+logger.debug("FT_PASSWORD set: %s", bool(os.getenv('FT_PASSWORD')))
+
+# URLs Chrome is told not to fetch: the scraper only reads page text, so images,
+# fonts, media and ad/analytics scripts are dead weight on every page load
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.mp4', '*.webm',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*facebook.net*',
+]
+
+# Content settings that stop images loading and notification prompts at the
+# renderer, including anything BLOCKED_URL_PATTERNS does not match
+CHROME_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2,
+}
+
+class SharedService(Service):
+    """chromedriver service started once and shared by every driver.
+
+    webdriver.Chrome starts its service when created and stops it on quit();
+    here start() does nothing while chromedriver is already running and stop()
+    is deferred to shutdown(), so each new driver only opens a session on the
+    running chromedriver instead of launching its own.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        # Drivers are created from several threads at once by DriverPool
+        with self._start_lock:
+            process = getattr(self, 'process', None)
+            if process is None or process.poll() is not None:
+                super().start()
+
+    def stop(self):
+        pass
+
+    def shutdown(self):
+        """Stop chromedriver."""
+        super().stop()
+
+_shared_service: Optional[SharedService] = None
+_shared_service_lock = threading.Lock()
+
+def get_shared_service() -> SharedService:
+    """Return the process-wide chromedriver service, creating it on first use."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = SharedService(executable_path="./chromedriver.exe")
+            atexit.register(_shared_service.shutdown)
+        return _shared_service
+
+def build_driver() -> webdriver.Chrome:
+    """Create a headless Chrome driver with the scraper's standard options."""
+    # Set up Chrome options
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument('--headless')  # Run in headless mode
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-popup-blocking')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_experimental_option('prefs', CHROME_PREFS)
+    # driver.get returns at DOMContentLoaded instead of waiting for every
+    # tracker and late script; sections are server-rendered and the teaser
+    # wait covers the rest
+    chrome_options.page_load_strategy = 'eager'
+
+    driver = webdriver.Chrome(service=get_shared_service(), options=chrome_options)
+    driver.set_page_load_timeout(30)  # Set page load timeout
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    return driver
+
+class DriverPool:
+    """Pool of headless Chrome drivers shared by concurrent scraping tasks.
+
+    Drivers are recycled after max_uses checkouts to keep Chrome's memory
+    growth in check. A driver that could not be replaced leaves its slot
+    empty, and acquire builds a new one when it finds the pool short.
+    """
+
+    def __init__(self, size: int = 4, max_uses: int = 50):
+        self.size = size
+        self.max_uses = max_uses
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._uses: Dict[int, int] = {}
+        # Drivers alive (idle, checked out or being built)
+        self._live = 0
+
+    async def start(self) -> None:
+        """Create the pool's drivers."""
+        drivers = await asyncio.gather(*(asyncio.to_thread(build_driver) for _ in range(self.size)))
+        for driver in drivers:
+            self._uses[id(driver)] = 0
+            self._queue.put_nowait(driver)
+        self._live = len(drivers)
+        logger.info(f"Driver pool started with {self.size} drivers")
+
+    async def acquire(self) -> webdriver.Chrome:
+        """Wait for a free driver and check it out, building one for an empty slot."""
+        if self._queue.empty() and self._live < self.size:
+            self._live += 1
+            try:
+                driver = await asyncio.to_thread(build_driver)
+            except Exception:
+                self._live -= 1
+                raise
+            self._uses[id(driver)] = 0
+            return driver
+        return await self._queue.get()
+
+    async def release(self, driver: webdriver.Chrome) -> None:
+        """Return a driver to the pool, replacing it once it is worn out."""
+        uses = self._uses.pop(id(driver), 0) + 1
+        if uses >= self.max_uses:
+            logger.info(f"Recycling Chrome driver after {uses} uses")
+            try:
+                await asyncio.to_thread(driver.quit)
+            except Exception as e:
+                logger.warning(f"Error quitting recycled driver: {str(e)}")
+            try:
+                driver = await asyncio.to_thread(build_driver)
+            except Exception as e:
+                # The next acquire that finds the pool short retries
+                logger.warning(f"Error replacing recycled driver: {str(e)}")
+                self._live -= 1
+                return
+            uses = 0
+        self._uses[id(driver)] = uses
+        self._queue.put_nowait(driver)
+
+    async def close(self) -> None:
+        """Quit every idle driver in the pool."""
+        while not self._queue.empty():
+            driver = self._queue.get_nowait()
+            self._uses.pop(id(driver), None)
+            self._live -= 1
+            try:
+                await asyncio.to_thread(driver.quit)
+            except Exception as e:
+                logger.warning(f"Error quitting pooled driver: {str(e)}")
 
 class FTScraper:
     def __init__(self, username: str = None, uni_id: str = None, password: str = None):
@@ -95,6 +250,7 @@ class FTScraper:
         
         # Load existing progress
         self.progress_file = os.path.join(self.data_dir, "scraping_progress.json")
+        self.store = ArticleStore(os.path.join(self.data_dir, "ft.db"))
         self.load_progress()
 
     async def initialize(self):
@@ -111,26 +267,11 @@ class FTScraper:
 
     def _sync_init(self):
         try:
-            # Set up Chrome options
-            chrome_options = webdriver.ChromeOptions()
-            chrome_options.add_argument('--headless')  # Run in headless mode
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--remote-debugging-port=9222')  # Add debugging port
-            chrome_options.add_argument('--disable-extensions')
-            chrome_options.add_argument('--disable-popup-blocking')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
             # Use local ChromeDriver with retry logic
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    service = Service(executable_path="./chromedriver.exe")
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                    self.driver.set_page_load_timeout(30)  # Set page load timeout
+                    self.driver = build_driver()
                     print("Selenium WebDriver initialized successfully")
                     return
                 except Exception as e:
@@ -146,22 +287,34 @@ class FTScraper:
     def load_progress(self) -> None:
         """Load existing scraping progress."""
         try:
+            self.visited_urls = self.store.load_visited_urls()
             if os.path.exists(self.progress_file):
                 with open(self.progress_file, 'r', encoding='utf-8') as f:
                     progress_data = json.load(f)
-                    self.visited_urls = set(progress_data.get('visited_urls', []))
                     self.seen_preview_urls = set(progress_data.get('seen_preview_urls', []))
-                    print(f"Loaded {len(self.visited_urls)} previously visited URLs")
+                    if not self.visited_urls:
+                        # One-off import of URLs saved before the SQLite store existed
+                        self.visited_urls = set(progress_data.get('visited_urls', []))
+                        self.store.add_visited_urls(self.visited_urls)
+            print(f"Loaded {len(self.visited_urls)} previously visited URLs")
         except Exception as e:
             print(f"Failed to load progress: {str(e)}")
             self.visited_urls = set()
             self.seen_preview_urls = set()
 
+    def record_visited_urls(self, urls: Iterable[str]) -> None:
+        """Mark a batch of URLs as visited and persist them."""
+        try:
+            self.visited_urls.update(urls)
+            self.store.add_visited_urls(urls)
+        except Exception as e:
+            print(f"Failed to save visited URLs: {str(e)}")
+
     def _save_visited_urls(self) -> None:
         """Save current scraping progress."""
         try:
+            self.store.add_visited_urls(self.visited_urls)
             progress_data = {
-                'visited_urls': list(self.visited_urls),
                 'seen_preview_urls': list(self.seen_preview_urls),
                 'timestamp': datetime.now().isoformat()
             }